@@ -4,9 +4,9 @@ Imports and exports all custom data handling functions.
 """
 
 from .collection import chunk_it, flatten_matrix, filter_dict_keys_by_value, filter_list_of_dicts_by_value
-from .numeric_data import convert_number_to_currency, convert_string_to_float
-from .text_data import remove_special_characters
-from .operations import prepare_regex_pattern, match_string
+from .numeric_data import convert_number_to_currency, convert_string_to_float, convert_strings_to_float
+from .text_data import remove_special_characters, remove_special_characters_many
+from .operations import prepare_regex_pattern, match_string, match_string_many
 
 __all__ = [
     "chunk_it",
@@ -15,7 +15,10 @@ __all__ = [
     "filter_list_of_dicts_by_value",
     "convert_number_to_currency",
     "convert_string_to_float",
+    "convert_strings_to_float",
     "remove_special_characters",
+    "remove_special_characters_many",
     "prepare_regex_pattern",
-    "match_string"
+    "match_string",
+    "match_string_many"
 ]
\ No newline at end of file
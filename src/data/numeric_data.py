@@ -1,5 +1,8 @@
-import re
-from typing import Literal
+import numpy as np
+import pandas as pd
+from typing import Literal, Sequence
+
+_SWAP_SEPARATORS = str.maketrans(",.", ".,")
 
 
 def convert_string_to_float(number_text: str, raise_exception: bool = True, return_on_error: float | None = 0.0) -> float | None:
@@ -34,36 +37,161 @@ def convert_string_to_float(number_text: str, raise_exception: bool = True, retu
         >>> convert_string_to_float("invalid", raise_exception=False, return_on_error=None)
         None
     """
-    try:
-        if not isinstance(number_text, str):
-            raise ValueError("Input must be a string")
-        
+    if not isinstance(number_text, str):
+        error_message = "Input must be a string"
+    else:
         number_text = number_text.strip()
-        if number_text == "":
-            raise ValueError("Input string is empty")
+        if not number_text:
+            error_message = "Input string is empty"
+        else:
+            number = _parse_number_text(number_text)
+            if number is not None:
+                return number
+            error_message = f"Cannot convert '{number_text}' to float"
 
-        try:
-            return float(number_text)
-        except Exception:
-            pass
+    # Errors are only raised when requested, so the fallback path builds no exception objects
+    if raise_exception:
+        raise ValueError(error_message)
 
-        # Brazilian format: 1.234,56
-        number = re.search(r"^[\d{3}\.]+\,?\d*$", number_text)
-        if number:
-            return float(number.group().strip().replace(".", "").replace(",", "."))
+    return return_on_error
 
-        # American format: 1,234.56
-        number = re.search(r"^[\d{3},]+\.?\d*$", number_text)
-        if number:
-            return float(number.group().strip().replace(",", ""))
 
-        raise ValueError(f"Cannot convert '{number_text}' to float")
+def _parse_number_text(number_text: str) -> float | None:
+    """
+    Parse a stripped, non-empty number string without raising on invalid input.
     
-    except Exception as e:
-        if raise_exception:
-            raise e
+    Args:
+        number_text: String representation of the number (already stripped)
+    
+    Returns:
+        The parsed float value, or None if the string is not a valid number
+    """
+    try:
+        return float(number_text)
+    except ValueError:
+        pass
+
+    # Thousand-separated formats only contain digits and separators
+    if not number_text.replace(".", "").replace(",", "").isdecimal():
+        return None
+
+    # The format is decided by the rightmost separator, found with two C-level scans
+    last_comma = number_text.rfind(",")
+    last_dot = number_text.rfind(".")
+
+    # Brazilian format: 1.234,56
+    if last_dot < last_comma or last_comma == -1:
+        if number_text.count(",") <= 1 and last_comma != 0:
+            return float(number_text.replace(".", "").replace(",", "."))
+
+    # American format: 1,234.56
+    if last_comma < last_dot or last_dot == -1:
+        if number_text.count(".") <= 1 and last_dot != 0:
+            return float(number_text.replace(",", ""))
+
+    return None
+
+
+def _parse_number_texts(texts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized _parse_number_text for an array of stripped strings.
+    
+    Args:
+        texts: NumPy string array of stripped number texts
+    
+    Returns:
+        Tuple of (parsed floats with NaN where parsing failed, mask of successfully parsed values)
+    """
+    numbers = np.full(len(texts), np.nan)
+    converted = np.zeros(len(texts), dtype=bool)
+    
+    # Thousand-separated formats, decided by the rightmost separator
+    without_dots = np.strings.replace(texts, ".", "")
+    separated = np.strings.isdecimal(np.strings.replace(without_dots, ",", ""))
+    last_comma = np.strings.rfind(texts, ",")
+    last_dot = np.strings.rfind(texts, ".")
+    brazilian = separated & ((last_dot < last_comma) | (last_comma == -1)) & (np.strings.count(texts, ",") <= 1) & (last_comma != 0)
+    american = separated & ~brazilian & ((last_comma < last_dot) | (last_dot == -1)) & (np.strings.count(texts, ".") <= 1) & (last_dot != 0)
+    
+    # Whole arrays are rewritten and then selected, since np.strings.replace rejects empty arrays
+    numbers[brazilian] = np.strings.replace(without_dots, ",", ".")[brazilian].astype(object).astype(float)
+    numbers[american] = np.strings.replace(texts, ",", "")[american].astype(object).astype(float)
+    converted |= brazilian | american
+    
+    # Exponents, underscores, "inf" and the like only parse through float()
+    for position in np.flatnonzero(~separated & (np.strings.str_len(texts) > 0)):
+        number = _parse_number_text(str(texts[position]))
+        if number is not None:
+            numbers[position] = number
+            converted[position] = True
     
-        return return_on_error
+    return numbers, converted
+
+
+def convert_strings_to_float(numbers_text: Sequence[str] | pd.Series, raise_exception: bool = True, return_on_error: float | None = 0.0) -> pd.Series:
+    """
+    Convert a sequence of number strings to floats with vectorized NumPy string operations.
+    
+    Bulk counterpart of convert_string_to_float for whole columns (e.g. a CSV column).
+    Each value follows the same rules: standard Python float format first, then
+    Brazilian format ("1.234,56"), then American format ("1,234.56"). Only values
+    outside these formats (exponents, "inf", invalid text) are parsed one by one.
+    
+    Args:
+        numbers_text: List, NumPy array or pandas Series of number strings
+        raise_exception: If True, raises exception if any value cannot be converted; if False, failed values are replaced by return_on_error
+        return_on_error: Value used for failed conversions when raise_exception is False (None keeps them as NaN)
+    
+    Returns:
+        Float Series with the converted values (index preserved when a Series is given)
+    
+    Raises:
+        ValueError: If any value is not a string, is empty, or cannot be converted to float (when raise_exception is True)
+    
+    Examples:
+        >>> convert_strings_to_float(["123.45", "1.234,56", "1,234.56"]).tolist()
+        [123.45, 1234.56, 1234.56]
+        >>> convert_strings_to_float(["10", "invalid"], raise_exception=False, return_on_error=-1.0).tolist()
+        [10.0, -1.0]
+    """
+    values = pd.Series(numbers_text, dtype=object)
+    all_strings = pd.api.types.infer_dtype(values, skipna=False) == "string"
+    if all_strings:
+        try:
+            # astype(float) applies float() to every value in one C-level pass, exactly like the
+            # scalar function's first step, so columns without thousand separators end here
+            return values.astype(float)
+        except ValueError:
+            pass
+    
+    numbers = np.full(len(values), np.nan)
+    failed = np.ones(len(values), dtype=bool)
+    is_string = np.ones(len(values), dtype=bool) if all_strings else values.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+    
+    if is_string.any():
+        positions = np.flatnonzero(is_string)
+        raw = values.to_numpy()[is_string]
+        texts = np.strings.strip(raw.astype(str))
+        
+        # Plain decimals (one optional sign, at most one dot) go straight to float(); pd.to_numeric
+        # is avoided because its faster parser can be off by one ulp
+        unsigned = np.strings.lstrip(texts, "+-")
+        plain = (np.strings.str_len(texts) - np.strings.str_len(unsigned) <= 1) & np.strings.isdecimal(np.strings.replace(unsigned, ".", "", 1))
+        numbers[positions[plain]] = raw[plain].astype(float)
+        failed[positions[plain]] = False
+        
+        others = np.flatnonzero(~plain)
+        if others.size:
+            numbers[positions[others]], converted = _parse_number_texts(texts[others])
+            failed[positions[others]] = ~converted
+
+    result = pd.Series(numbers, index=values.index)
+    if failed.any():
+        if raise_exception:
+            raise ValueError(f"Cannot convert '{values[failed].iloc[0]}' to float")
+        result[failed] = return_on_error
+
+    return result
 
 
 def convert_number_to_currency(value: int | float, symbol: str = "R$", decimal_places: int = 2, decimal_separator: Literal[",", "."] = ",") -> str:
@@ -93,24 +221,14 @@ def convert_number_to_currency(value: int | float, symbol: str = "R$", decimal_p
     if not isinstance(value, (int, float)):
         raise ValueError("Input must be a number")
     
-    absolute_value = abs(value)
-    sign = "-" if value < 0 else ""
+    # Fast path for the default Brazilian format: format American-style, then swap separators
+    if symbol == "R$" and decimal_places == 2 and decimal_separator == ",":
+        return f"{'-' if value < 0 else ''}R$ {abs(value):,.2f}".translate(_SWAP_SEPARATORS)
     
-    formatted_value = f"{absolute_value:.{decimal_places}f}"
-
+    sign = "-" if value < 0 else ""
+    # The "," format option groups thousands in C; Brazilian format only swaps the separators
+    formatted_value = f"{abs(value):,.{decimal_places}f}"
     if decimal_separator == ",":
-        thousand_separator = "."
-    else:
-        thousand_separator = ","
-
-    parts = formatted_value.split(".")
-    integer_part = parts[0]
-    decimal_part = parts[1] if len(parts) > 1 else "0"*decimal_places
-    
-    formatted_integer = ""
-    for i, digit in enumerate(reversed(integer_part)):
-        if i > 0 and i % 3 == 0:
-            formatted_integer = thousand_separator + formatted_integer
-        formatted_integer = digit + formatted_integer
+        formatted_value = formatted_value.translate(_SWAP_SEPARATORS)
 
-    return f"{sign}{symbol} {formatted_integer}{decimal_separator if decimal_part else ''}{decimal_part}"
+    return f"{sign}{symbol} {formatted_value}"
@@ -1,5 +1,8 @@
 import re
 
+_REGEX_TAG_PATTERN = re.compile(r"<regex>(.*?)</regex>", re.DOTALL)
+
+
 def prepare_regex_pattern(term: str, space_between_chars: bool = False) -> str:
     """
     Prepare a regex pattern from a search term, optionally allowing spaces between characters.
@@ -23,6 +26,10 @@ def prepare_regex_pattern(term: str, space_between_chars: bool = False) -> str:
     if not term:
         return term
 
+    # Plain ASCII alphanumeric terms have nothing to escape
+    if not space_between_chars and term.isascii() and term.isalnum():
+        return term
+
     place_holder = "<<<REGEX_PLACEHOLDER>>>"
     raw_regex = None
     start_pos = 0
@@ -30,12 +37,11 @@ def prepare_regex_pattern(term: str, space_between_chars: bool = False) -> str:
     regex_term = False
     
     # Extract raw regex content between <regex></regex> tags
-    if "<regex>" in term and "</regex>" in term:
-        start_pos = term.index("<regex>")
-        end_pos = term.index("</regex>")
-        raw_regex = term[start_pos + len("<regex>"):end_pos]
+    tag_match = _REGEX_TAG_PATTERN.search(term)
+    if tag_match:
+        raw_regex = tag_match.group(1)
         # Temporarily replace with placeholder
-        term = term[:start_pos] + place_holder + term[end_pos + len("</regex>"):]
+        term = term[:tag_match.start()] + place_holder + term[tag_match.end():]
 
         regex_term = True
 
@@ -77,6 +83,29 @@ def prepare_regex_pattern(term: str, space_between_chars: bool = False) -> str:
     return term
 
 
+def _compile_search_pattern(search_value: str, prepare_search_value: bool, case_sensitive: bool) -> re.Pattern | None:
+    """
+    Compile a search value into a regex pattern for match_string.
+    
+    Args:
+        search_value: The regex pattern (or term, when prepare_search_value is True).
+        prepare_search_value: If True, process the value with prepare_regex_pattern() first.
+        case_sensitive: If False, compile with re.IGNORECASE.
+        
+    Returns:
+        re.Pattern | None: The compiled pattern, or None if the pattern is invalid.
+    """
+    try:
+        if prepare_search_value:
+            search_value = prepare_regex_pattern(search_value)
+        
+        return re.compile(search_value, 0 if case_sensitive else re.IGNORECASE)
+    
+    except re.error:
+        # Invalid regex pattern
+        return None
+
+
 def match_string(search_value: str, comparison: str, regex: bool = False, prepare_search_value: bool = False, case_sensitive: bool = False, exact_match: bool = False) -> bool:
     """
     Check if a search value matches a comparison string.
@@ -114,26 +143,79 @@ def match_string(search_value: str, comparison: str, regex: bool = False, prepar
     if not search_value and not comparison:
         return search_value == comparison
 
+    if not regex:
+        # Plain substring/equality check, no regex engine involved
+        if exact_match:
+            return search_value == comparison or (not case_sensitive and search_value.casefold() == comparison.casefold())
+        
+        if case_sensitive:
+            return search_value in comparison
+        return search_value.casefold() in comparison.casefold()
+
+    pattern = _compile_search_pattern(search_value, prepare_search_value, case_sensitive)
+    if pattern is None:
+        return False
+    
+    if exact_match:
+        return pattern.fullmatch(comparison) is not None
+    return pattern.search(comparison) is not None
+
+
+def match_string_many(search_values: list[str], comparison: str, regex: bool = False, prepare_search_value: bool = False, case_sensitive: bool = False, exact_match: bool = False) -> list[bool]:
+    """
+    Check several search values against the same comparison string.
+    
+    Equivalent to calling match_string() for each search value, but the comparison
+    string is case-folded only once for case-insensitive plain matching, and regex
+    flags and validation are resolved once for the whole batch.
+    
+    Args:
+        search_values: The values to search for.
+        comparison: The string to search in.
+        regex: If True, treat each search value as a regex pattern.
+        prepare_search_value: If True, escape special regex characters and process <regex>...</regex> tags. Only applies when regex=True.
+        case_sensitive: If True, perform case-sensitive matching.
+        exact_match: If True, require exact match (or full string match for regex).
+        
+    Returns:
+        list[bool]: One result per search value, in the same order.
+        
+    Example:
+        >>> match_string_many(["test", "xyz", "THIS"], "This is a test")
+        [True, False, True]
+    """
+    if not isinstance(comparison, str):
+        raise ValueError("comparison must be a string")
+    
+    if prepare_search_value and not regex:
+        raise ValueError("prepare_search_value can only be used when regex=True")
+    
     if regex:
-        try:
-            if prepare_search_value:
-                search_value = prepare_regex_pattern(search_value)
+        results = []
+        for search_value in search_values:
+            if not isinstance(search_value, str):
+                raise ValueError("search_value must be a string")
             
-            if exact_match:
-                search_value = r"^" + search_value + r"$"
-            
-            flags = 0 if case_sensitive else re.IGNORECASE
-            return re.search(search_value, comparison, flags=flags) is not None
-            
-        except re.error:
-            # Invalid regex pattern
-            return False
-    else:
-        if not case_sensitive:
-            search_value = search_value.lower()
-            comparison = comparison.lower()
+            pattern = _compile_search_pattern(search_value, prepare_search_value, case_sensitive)
+            if pattern is None:
+                results.append(False)
+            else:
+                match = pattern.fullmatch(comparison) if exact_match else pattern.search(comparison)
+                results.append(match is not None)
         
-        if exact_match:
-            return search_value == comparison
-        else:
-            return search_value in comparison
+        return results
+    
+    if case_sensitive:
+        return [match_string(value, comparison, case_sensitive=True, exact_match=exact_match) for value in search_values]
+    
+    # Hoist the comparison case folding out of the loop
+    folded_comparison = comparison.casefold()
+    results = []
+    for search_value in search_values:
+        if not isinstance(search_value, str):
+            raise ValueError("search_value must be a string")
+        
+        folded_value = search_value.casefold()
+        results.append(folded_value == folded_comparison if exact_match else folded_value in folded_comparison)
+    
+    return results
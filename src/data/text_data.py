@@ -1,5 +1,11 @@
 import re
 
+# ASCII bytes removed when keep_unicode=False: everything but letters, digits and whitespace
+_ASCII_SPECIAL_BYTES = bytes(c for c in range(128) if not (chr(c).isalnum() or chr(c).isspace()))
+_UNICODE_SPECIAL_PATTERN = re.compile(r"[^\w\s]|_")
+_ASCII_SPECIAL_PATTERN = re.compile(r"[^a-zA-Z0-9\s]")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
 def remove_special_characters(text: str, keep_unicode: bool = True, normalize_whitespace: bool = True, remove_whitespace: bool = False) -> str:
     """
     Remove punctuation and special characters from a string, keeping only alphanumeric characters and spaces.
@@ -33,19 +39,74 @@ def remove_special_characters(text: str, keep_unicode: bool = True, normalize_wh
     if not isinstance(text, str):
         raise ValueError("Input must be a string")
 
+    return _clean_text(text, keep_unicode, normalize_whitespace, remove_whitespace)
+
+
+def remove_special_characters_many(texts: list[str], keep_unicode: bool = True, normalize_whitespace: bool = True, remove_whitespace: bool = False) -> list[str]:
+    """
+    Remove punctuation and special characters from several strings at once.
+    
+    Bulk counterpart of remove_special_characters: options are validated once for the
+    whole batch and every string goes through the same precompiled patterns.
+    
+    Args:
+        texts: The strings from which special characters will be removed.
+        keep_unicode: If True, keeps Unicode word characters. If False, keeps only ASCII letters and digits. Default is True.
+        normalize_whitespace: If True, collapses multiple consecutive spaces into one.
+                              Ignored if remove_whitespace is True. Default is True.
+        remove_whitespace: If True, removes all whitespace from the strings. Default is False.
+    
+    Returns:
+        list[str]: The cleaned strings, in the same order.
+    
+    Raises:
+        ValueError: If any item is not a string.
+    
+    Examples:
+        >>> remove_special_characters_many(["Hello, World!", "Price: $100"])
+        ["Hello World", "Price 100"]
+    """
+    if normalize_whitespace and remove_whitespace:
+        raise ValueError("normalize_whitespace cannot be True when remove_whitespace is True")
+    
+    if not all(isinstance(text, str) for text in texts):
+        raise ValueError("Input must be a string")
+
+    return [_clean_text(text, keep_unicode, normalize_whitespace, remove_whitespace) for text in texts]
+
+
+def _clean_text(text: str, keep_unicode: bool, normalize_whitespace: bool, remove_whitespace: bool) -> str:
+    """
+    Apply the special character removal to an already validated string.
+    
+    Args:
+        text: The string to clean.
+        keep_unicode: If True, keeps Unicode word characters; otherwise only ASCII letters and digits.
+        normalize_whitespace: If True, collapses multiple consecutive spaces into one.
+        remove_whitespace: If True, removes all whitespace.
+    
+    Returns:
+        str: The cleaned string.
+    """
+    # Empty or plain ASCII alphanumeric text has nothing to remove
+    if not text or (text.isascii() and text.isalnum()):
+        return text
+
     if keep_unicode:
         # Remove punctuation and special chars, but keep Unicode letters/digits
-        text = re.sub(r"[^\w\s]|_", "", text)
+        text = _UNICODE_SPECIAL_PATTERN.sub("", text)
+    elif text.isascii():
+        # Only keep ASCII letters, digits, and spaces (byte-level delete table, no per-char regex work)
+        text = text.encode("ascii").translate(None, _ASCII_SPECIAL_BYTES).decode("ascii")
     else:
         # Only keep ASCII letters, digits, and spaces
-        text = re.sub(r"[^a-zA-Z0-9\s]", "", text)
+        text = _ASCII_SPECIAL_PATTERN.sub("", text)
 
     if remove_whitespace:
-        text = re.sub(r"\s+", "", text)
+        text = _WHITESPACE_PATTERN.sub("", text)
     else:
         if normalize_whitespace:
-            text = re.sub(r"\s+", " ", text)
+            text = _WHITESPACE_PATTERN.sub(" ", text)
         text = text.strip()
 
     return text
-
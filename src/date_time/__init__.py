@@ -3,13 +3,14 @@ Custom datetime module.
 Imports and exports all datetime handling functions.
 """
 
-from .operations import get_now, is_timezone, is_timezone_aware, add_days_to_date, get_month_start_end, format_date
+from .operations import get_now, is_timezone, is_timezone_aware, add_days_to_date, add_days_to_dates, get_month_start_end, format_date
 
 __all__ = [
     "get_now",
     "is_timezone",
     "is_timezone_aware",
     "add_days_to_date",
+    "add_days_to_dates",
     "get_month_start_end",
     "format_date"
 ]
@@ -1,8 +1,24 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Callable, Sequence
 import calendar
+import re
+import pandas as pd
 import pytz
 
 
+_VALID_TIMEZONES = frozenset(pytz.all_timezones)
+_FORMAT_DIRECTIVE_PATTERN = re.compile(r"%.")
+_FORMAT_FIELDS = {
+    "%Y": "{0.year}",
+    "%m": "{0.month:02d}",
+    "%d": "{0.day:02d}",
+    "%H": "{0.hour:02d}",
+    "%M": "{0.minute:02d}",
+    "%S": "{0.second:02d}",
+}
+
+
 def get_now(format: str = "%Y-%m-%d %H:%M:%S", add_days: int = 0, timezone: str = "America/Sao_Paulo", as_string: bool = True, return_tzinfo: bool = False) -> datetime | str:
     """
     Get the current datetime in a specific timezone with optional day offset.
@@ -39,7 +55,7 @@ def is_timezone(tz_string: str) -> bool:
     Returns:
         True if valid timezone, False otherwise
     """
-    return tz_string in pytz.all_timezones
+    return tz_string in _VALID_TIMEZONES
 
 
 def is_timezone_aware(dt: datetime) -> bool:
@@ -79,6 +95,47 @@ def add_days_to_date(date: datetime, add_days: int, format: str = "%Y-%m-%d %H:%
         return date
 
 
+def add_days_to_dates(dates: Sequence[datetime] | pd.Series, add_days: int, format: str = "%Y-%m-%d %H:%M:%S", as_string: bool = True, return_tzinfo: bool = False) -> pd.Series:
+    """
+    Add or subtract days from a sequence of dates in a single vectorized pass.
+    
+    Bulk counterpart of add_days_to_date: the offset is applied to the whole
+    datetime64 column at once instead of building one datetime per value.
+    Timezone-aware inputs must all share the same timezone; days are added
+    to the local wall-clock time and each value keeps its original UTC offset,
+    as pytz datetimes do in add_days_to_date.
+    
+    Args:
+        dates: List, NumPy array or pandas Series of datetime objects
+        add_days: Number of days to add (can be negative)
+        format: String format for output if as_string is True (default: "%Y-%m-%d %H:%M:%S")
+        as_string: If True, return formatted strings; if False, return datetimes (default: True)
+        return_tzinfo: If True and as_string is False, keep timezone info (default: False)
+    
+    Returns:
+        Series of formatted strings or datetimes (index preserved when a Series is given)
+    
+    Examples:
+        >>> add_days_to_dates([datetime(2023, 5, 15), datetime(2023, 12, 31)], add_days=1).tolist()
+        ['2023-05-16 00:00:00', '2024-01-01 00:00:00']
+    """
+    dates = pd.to_datetime(pd.Series(dates))
+    tz = dates.dt.tz
+    offset = pd.Timedelta(days=add_days)
+    # Shift wall-clock time, like datetime + timedelta does for a single date
+    result = (dates.dt.tz_localize(None) if tz is not None else dates) + offset
+
+    if as_string:
+        if tz is not None:
+            return _strftime_with_original_offsets(result, dates, format)
+        return result.dt.strftime(format)
+    if return_tzinfo and tz is not None:
+        # A pytz datetime keeps its UTC offset through + timedelta, so the scalar result is the same
+        # instant as shifting the aware values; re-localizing the wall time could land in a DST gap
+        return dates + offset
+    return result
+
+
 def get_month_start_end(year: int, month: int, format: str = "%Y-%m-%d", as_string: bool = True) -> tuple[str | datetime, str | datetime]:
     """
     Get the start and end dates of a specific month.
@@ -114,5 +171,64 @@ def format_date(date_string: str, original_format: str = "%d/%m/%Y %H:%M:%S", ne
     Returns:
         Reformatted date string
     """
-    return datetime.strptime(date_string, original_format).strftime(new_format)
+    return _compile_date_formatter(new_format)(datetime.strptime(date_string, original_format))
 
+
+@lru_cache(maxsize=128)
+def _compile_date_formatter(format: str) -> Callable[[datetime], str]:
+    """
+    Build a reusable formatter equivalent to datetime.strftime for a format string.
+    
+    Formats made only of %Y, %m, %d, %H, %M and %S are translated once into a
+    str.format template; any other directive falls back to strftime.
+    
+    Args:
+        format: strftime format string
+    
+    Returns:
+        Callable that formats a datetime object as a string
+    """
+    parts = []
+    position = 0
+    for match in _FORMAT_DIRECTIVE_PATTERN.finditer(format):
+        field = _FORMAT_FIELDS.get(match.group())
+        if field is None:
+            return lambda dt: dt.strftime(format)
+        parts.append(format[position:match.start()].replace("{", "{{").replace("}", "}}"))
+        parts.append(field)
+        position = match.end()
+    parts.append(format[position:].replace("{", "{{").replace("}", "}}"))
+    template = "".join(parts)
+
+    def formatter(dt: datetime) -> str:
+        # strftime zero-pads years below 1000 differently across platforms
+        if dt.year < 1000:
+            return dt.strftime(format)
+        return template.format(dt)
+
+    return formatter
+
+
+def _strftime_with_original_offsets(shifted: pd.Series, original: pd.Series, format: str) -> pd.Series:
+    """
+    Format shifted wall-clock times, taking %z and %Z from the original aware values.
+    
+    Args:
+        shifted: Naive Series of shifted wall-clock times
+        original: Timezone-aware Series the shifted values were computed from
+        format: strftime format string
+    
+    Returns:
+        Series of formatted strings, as strftime on each shifted pytz datetime would give
+    """
+    parts = []
+    position = 0
+    for match in _FORMAT_DIRECTIVE_PATTERN.finditer(format):
+        if match.group() in ("%z", "%Z"):
+            if position < match.start():
+                parts.append(shifted.dt.strftime(format[position:match.start()]))
+            parts.append(original.dt.strftime(match.group()))
+            position = match.end()
+    if position < len(format) or not parts:
+        parts.append(shifted.dt.strftime(format[position:]))
+    return sum(parts[1:], parts[0])
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 import pandas as pd
 from datetime import timezone
+from functools import lru_cache
 from typing import Dict, Any
 import re
 import pandas as pd
@@ -102,10 +103,13 @@ class DatabaseConnection(ABC):
         pass
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _is_valid_identifier(identifier: str) -> bool:
         """
         Validate SQL identifier to prevent injection attacks.
         
+        Results are cached, since the same table and column names are validated on every call.
+        
         Args:
             identifier: Table or column name to validate
         
@@ -35,6 +35,7 @@ class DatabaseFactory:
         "sqlite": SQLiteConnection,
         "mysql": MySQLConnection
     }
+    _SUPPORTED_TYPES: tuple[str, ...] = tuple(_CONNECTORS)
     
     @classmethod
     def create_connection(cls, db_type: DatabaseType, **connection_params: Any) -> DatabaseConnection:
@@ -75,7 +76,7 @@ class DatabaseFactory:
             >>> # )
         """
         if db_type not in cls._CONNECTORS:
-            supported = ", ".join(cls._CONNECTORS.keys())
+            supported = ", ".join(cls._SUPPORTED_TYPES)
             raise ValueError(f"Unsupported database type: '{db_type}'. Supported types: {supported}")
         
         connector_class = cls._CONNECTORS[db_type]
@@ -119,6 +120,30 @@ class DatabaseFactory:
             raise TypeError(f"Connector class must inherit from DatabaseConnection, got {connector_class.__name__}")
         
         cls._CONNECTORS[db_type] = connector_class
+        cls._SUPPORTED_TYPES = tuple(cls._CONNECTORS)
+    
+    @classmethod
+    def unregister_connector(cls, db_type: str) -> None:
+        """
+        Remove a previously registered database connector type.
+        
+        Args:
+            db_type: Database type identifier to remove
+        
+        Raises:
+            ValueError: If db_type is not registered
+        
+        Example:
+            >>> DatabaseFactory.register_connector("customdb", CustomDBConnection)
+            >>> DatabaseFactory.unregister_connector("customdb")
+            >>> DatabaseFactory.is_supported("customdb")
+            False
+        """
+        if db_type not in cls._CONNECTORS:
+            raise ValueError(f"Database type '{db_type}' is not registered")
+        
+        del cls._CONNECTORS[db_type]
+        cls._SUPPORTED_TYPES = tuple(cls._CONNECTORS)
     
     @classmethod
     def get_supported_types(cls) -> list[str]:
@@ -132,7 +157,7 @@ class DatabaseFactory:
             >>> types = DatabaseFactory.get_supported_types()
             >>> print(f"Supported databases: {', '.join(types)}")
         """
-        return list(cls._CONNECTORS.keys())
+        return list(cls._SUPPORTED_TYPES)
     
     @classmethod
     def is_supported(cls, db_type: str) -> bool:
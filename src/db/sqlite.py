@@ -9,6 +9,19 @@ from .base import DatabaseConnection
 
 ISOLATION_LEVEL: TypeAlias = Literal["DEFERRED", "IMMEDIATE", "EXCLUSIVE", None]
 
+# Host parameters per statement; 999 is the lowest limit across SQLite builds (SQLITE_MAX_VARIABLE_NUMBER before 3.32)
+_MAX_SQL_PARAMETERS = 999
+
+# Size of the driver's per-connection prepared statement LRU (sqlite3 default: 128), keyed by SQL text
+_CACHED_STATEMENTS = 256
+
+_FAST_PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -65536;
+"""
+
 class SQLiteConnection(DatabaseConnection):
     """
     Safe interface for SQLite database operations with automatic transaction management.
@@ -18,6 +31,7 @@ class SQLiteConnection(DatabaseConnection):
     
     Attributes:
         db_path (Path): Path to SQLite database file
+        fast_pragmas (bool): Whether write-throughput PRAGMAs are applied on connect
         primary_key_column (str | None): Primary key column name for insert operations
         db_connection (sqlite3.Connection | None): Active database connection
         db_cursor (sqlite3.Cursor | None): Active database cursor
@@ -32,19 +46,22 @@ class SQLiteConnection(DatabaseConnection):
         ...     df = db.select('users', filters={'name': 'John'})
     """
     
-    def __init__(self, db_path: str, primary_key_column: str | None = None):
+    def __init__(self, db_path: str, primary_key_column: str | None = None, fast_pragmas: bool = False):
         """
         Initialize database connection interface.
         
         Args:
             db_path: Path to SQLite database file (created if doesn't exist)
             primary_key_column: Primary key column name (required for returning inserted records)
+            fast_pragmas: Apply write-throughput PRAGMAs on connect (WAL journal, synchronous=NORMAL,
+                in-memory temp store, 64 MiB page cache). Trades durability on power loss for speed
         
         Raises:
             ValueError: If primary_key_column contains invalid characters
         """
         super().__init__(primary_key_column)
         self.db_path = Path(db_path)
+        self.fast_pragmas = fast_pragmas
         self.db_connection: sqlite3.Connection | None = None
         self.db_cursor: sqlite3.Cursor | None = None
 
@@ -64,6 +81,8 @@ class SQLiteConnection(DatabaseConnection):
                 - DEFERRED: lock acquired on first read/write (default, best for reads)
                 - IMMEDIATE: lock acquired immediately (good for writes)
                 - EXCLUSIVE: exclusive lock, blocks all clients
+            **kwargs: Additional keyword arguments passed to sqlite3.connect
+                (e.g. cached_statements to override the prepared statement cache size)
         
         Returns:
             Tuple of (connection, cursor) objects
@@ -72,21 +91,29 @@ class SQLiteConnection(DatabaseConnection):
             DatabaseError: If connection fails
         
         Note:
-            Returns existing connection if already connected
+            - Returns existing connection if already connected
+            - Sets row_factory to sqlite3.Row on the connection, so every cursor it creates returns named rows
         """
         if self.db_connection is not None and self.db_cursor is not None:
             return self.db_connection, self.db_cursor
         
+        kwargs.setdefault("cached_statements", _CACHED_STATEMENTS)
+        
         try:
             self.db_connection = sqlite3.connect(
                 self.db_path, 
                 timeout=timeout, 
-                isolation_level=isolation_level
+                isolation_level=isolation_level,
+                **kwargs
             )
             # Enable foreign key constraints enforcement in SQLite, so SQLite will:
             # Prevent inserting rows with invalid foreign key references; Prevent deleting parent rows that have dependent child rows; Enforce CASCADE, SET NULL, and other foreign key actions
             self.db_connection.execute("PRAGMA foreign_keys = ON")
             
+            if self.fast_pragmas:
+                # WAL lets readers run alongside a writer and, with synchronous=NORMAL, skips the fsync on every commit
+                self.db_connection.executescript(_FAST_PRAGMAS)
+            
             # Changes how query results are returned from tuples to dict-like objects. Access columns by name: row['name'] instead of row[0]
             self.db_connection.row_factory = sqlite3.Row
             
@@ -246,7 +273,8 @@ class SQLiteConnection(DatabaseConnection):
         
         Note:
             - All rows must have identical column names
-            - Uses executemany for efficient batch insertion
+            - Packs rows into multi-row INSERT statements, chunked to the SQLite parameter limit
+            - Inserted records are read back through INSERT ... RETURNING (SQLite 3.35+)
             - Transaction committed automatically on success
             - Automatic rollback on error
         """
@@ -268,29 +296,27 @@ class SQLiteConnection(DatabaseConnection):
         assert self.db_connection is not None and self.db_cursor is not None, "Database connection is not established"
         
         try:
-            first_id = None
-            if return_inserted and self.primary_key_column:
-                cursor = self.db_cursor.execute(
-                    f"SELECT MAX({self.primary_key_column}) FROM {table_name}"
-                )
-                max_id = cursor.fetchone()[0]
-                first_id = (max_id or 0) + 1
-            
+            returning = return_inserted and self.primary_key_column is not None
             columns = list(rows[0].keys())
-            placeholders = ','.join(['?' for _ in columns])
-            query = f"INSERT INTO {table_name} ({','.join(columns)}) VALUES ({placeholders})"
+            row_placeholders = f"({','.join(['?' for _ in columns])})"
+            rows_per_statement = max(1, _MAX_SQL_PARAMETERS // len(columns))
             
-            values_list = [list(row.values()) for row in rows]
-            self.db_cursor.executemany(query, values_list)
+            # Pack as many rows per INSERT as the parameter limit allows; values follow the
+            # first row's column order so rows with differently ordered keys line up
+            inserted = []
+            for start in range(0, len(rows), rows_per_statement):
+                chunk = rows[start:start + rows_per_statement]
+                query = f"INSERT INTO {table_name} ({','.join(columns)}) VALUES {','.join([row_placeholders] * len(chunk))}"
+                params = [row[column] for row in chunk for column in columns]
+                if returning:
+                    # read_sql runs the INSERT ... RETURNING and applies dtype/parse_dates the same way select() does
+                    inserted.append(pd.read_sql(f"{query} RETURNING *", self.db_connection, params=params, dtype=dtype, parse_dates=parse_dates))
+                else:
+                    self.db_cursor.execute(query, params)
             self.db_connection.commit()
             
-            if return_inserted and self.primary_key_column and first_id is not None:
-                last_id = first_id + len(rows) - 1
-                inserted_ids = list(range(first_id, last_id + 1))
-                
-                placeholders_ids = ','.join(['?' for _ in inserted_ids])
-                query = f"SELECT * FROM {table_name} WHERE {self.primary_key_column} IN ({placeholders_ids})"
-                df = pd.read_sql(query, self.db_connection, params=tuple(inserted_ids), dtype=dtype, parse_dates=parse_dates)
+            if returning:
+                df = inserted[0] if len(inserted) == 1 else pd.concat(inserted, ignore_index=True)
                 if localize_timezone and parse_dates and not df.empty:
                     df = self.adjust_datetime_timezone(df, localize_timezone, list(parse_dates.keys()))
                 return df
@@ -478,7 +504,8 @@ class SQLiteConnection(DatabaseConnection):
             commit: Whether to commit automatically after execution
         
         Returns:
-            Cursor with query results (use fetchall(), fetchone(), etc.)
+            Cursor with query results (use fetchall(), fetchone(), etc.); rows are
+            sqlite3.Row objects, indexable by column name or position
         
         Raises:
             DatabaseError: If query execution fails
@@ -511,6 +538,7 @@ class SQLiteConnection(DatabaseConnection):
         Note:
             - Uses IMMEDIATE isolation if commit=True, DEFERRED if commit=False
             - Automatic rollback on error if commit=True
+            - Repeated SQL text reuses the connection's compiled statement cache
         """
         self._connect_db(isolation_level="IMMEDIATE" if commit else "DEFERRED")
         assert self.db_connection is not None and self.db_cursor is not None, "Database connection is not established"
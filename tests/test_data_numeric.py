@@ -1,6 +1,10 @@
 import pytest
+import timeit
+import numpy as np
+import pandas as pd
 from src.data.numeric_data import (
     convert_string_to_float,
+    convert_strings_to_float,
     convert_number_to_currency
 )
 
@@ -58,6 +62,14 @@ class TestConvertStringToFloat:
         assert convert_string_to_float("1,234") == 1.234
         assert convert_string_to_float("1,000,000") == 1000000.0
     
+    def test_convert_rejects_signs_and_letters_in_separated_formats(self):
+        """Test convert_string_to_float rejects thousand-separated strings with extra characters"""
+        with pytest.raises(ValueError, match="Cannot convert"):
+            convert_string_to_float("-1.234,56")
+        
+        with pytest.raises(ValueError, match="Cannot convert"):
+            convert_string_to_float("1.234,56 R$")
+    
     def test_convert_invalid_input_not_string(self):
         """Test convert_string_to_float with non-string input raises ValueError"""
         with pytest.raises(ValueError, match="Input must be a string"):
@@ -108,6 +120,81 @@ class TestConvertStringToFloat:
         assert result is None
 
 
+class TestConvertStringsToFloat:
+    """Test cases for convert_strings_to_float function"""
+    
+    def test_convert_mixed_formats(self):
+        """Test convert_strings_to_float with standard, Brazilian and American formats"""
+        result = convert_strings_to_float(["123.45", "1.234,56", "1,234.56", "100"])
+        assert result.tolist() == [123.45, 1234.56, 1234.56, 100.0]
+    
+    def test_convert_matches_scalar_conversion(self):
+        """Test convert_strings_to_float returns the same values as convert_string_to_float"""
+        values = ["  123,45  ", "1.000.000,00", "999,999,999.99", "1.234", "1,234", "1,000,000", "\t100\n"]
+        assert convert_strings_to_float(values).tolist() == [convert_string_to_float(value) for value in values]
+    
+    def test_convert_matches_scalar_on_exponent_and_malformed_input(self):
+        """Test convert_strings_to_float agrees with convert_string_to_float on exponents and malformed strings"""
+        values = [
+            "43e28", "1e-7", "-2.5E+3", "13e 6", "1 000", "12abc", "inf", "1_000", "+-1", ".",
+            "1,", "1.2.3", "1,2,3", "1.2,3", "1,2.3", ",5", "1.234.567", "1,234,567", "-1,234.5"
+        ]
+        expected = [convert_string_to_float(value, raise_exception=False, return_on_error=None) for value in values]
+        result = convert_strings_to_float(values, raise_exception=False, return_on_error=None)
+        
+        assert [None if pd.isna(number) else number for number in result] == expected
+        
+        with pytest.raises(ValueError, match="Cannot convert '13e 6' to float"):
+            convert_strings_to_float(["1.5", "13e 6"])
+    
+    @pytest.mark.slow
+    @pytest.mark.parametrize("value", ["123456.78", "1.234.567,89"], ids=["plain", "brazilian"])
+    def test_convert_faster_than_scalar_loop(self, value):
+        """Test convert_strings_to_float beats calling convert_string_to_float per value"""
+        values = [value] * 50_000
+        bulk = min(timeit.repeat(lambda: convert_strings_to_float(values), number=1, repeat=5))
+        scalar = min(timeit.repeat(lambda: [convert_string_to_float(text) for text in values], number=1, repeat=5))
+        
+        assert bulk < scalar
+    
+    def test_convert_numpy_array(self):
+        """Test convert_strings_to_float with NumPy object array"""
+        result = convert_strings_to_float(np.array(["1,5", "2.5"], dtype=object))
+        assert result.tolist() == [1.5, 2.5]
+    
+    def test_convert_series_preserves_index(self):
+        """Test convert_strings_to_float keeps the index of a pandas Series"""
+        result = convert_strings_to_float(pd.Series(["1,5", "2.5"], index=["a", "b"]))
+        assert result.index.tolist() == ["a", "b"]
+        assert result.dtype == float
+    
+    def test_convert_empty_sequence(self):
+        """Test convert_strings_to_float with empty sequence returns empty Series"""
+        assert convert_strings_to_float([]).empty
+    
+    def test_convert_invalid_value_raises(self):
+        """Test convert_strings_to_float with invalid values raises ValueError"""
+        with pytest.raises(ValueError, match="Cannot convert 'abc'"):
+            convert_strings_to_float(["1.5", "abc"])
+        
+        with pytest.raises(ValueError, match="Cannot convert"):
+            convert_strings_to_float(["1.5", "   "])
+        
+        with pytest.raises(ValueError, match="Cannot convert '123'"):
+            convert_strings_to_float(["1.5", 123])  # type: ignore
+    
+    def test_convert_with_raise_exception_false(self):
+        """Test convert_strings_to_float replaces failed values with return_on_error"""
+        result = convert_strings_to_float(["1,5", "invalid", "", None], raise_exception=False, return_on_error=-1.0)  # type: ignore
+        assert result.tolist() == [1.5, -1.0, -1.0, -1.0]
+    
+    def test_convert_with_return_on_error_none(self):
+        """Test convert_strings_to_float keeps failed values as NaN when return_on_error is None"""
+        result = convert_strings_to_float(["1,5", "invalid"], raise_exception=False, return_on_error=None)
+        assert result.iloc[0] == 1.5
+        assert pd.isna(result.iloc[1])
+
+
 class TestConvertNumberToCurrency:
     """Test cases for convert_number_to_currency function"""
     
@@ -151,6 +238,8 @@ class TestConvertNumberToCurrency:
         assert convert_number_to_currency(1234.56, symbol="$") == "$ 1.234,56"
         assert convert_number_to_currency(1234.56, symbol="€") == "€ 1.234,56"
         assert convert_number_to_currency(1234.56, symbol="USD") == "USD 1.234,56"
+        assert convert_number_to_currency(1234.56, symbol="Fr.") == "Fr. 1.234,56"
+        assert convert_number_to_currency(-1234.56, symbol="Fr.", decimal_separator=".") == "-Fr. 1,234.56"
     
     def test_convert_number_custom_decimal_places(self):
         """Test convert_number_to_currency with custom decimal places"""
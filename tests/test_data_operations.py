@@ -1,7 +1,8 @@
 import pytest
 from src.data.operations import (
     prepare_regex_pattern,
-    match_string
+    match_string,
+    match_string_many
 )
 
 
@@ -112,6 +113,12 @@ class TestMatchString:
         assert match_string("test", "test", exact_match=True, case_sensitive=True) is True
         assert match_string("Test", "test", exact_match=True, case_sensitive=True) is False
     
+    def test_match_string_case_insensitive_casefold(self):
+        """Test match_string uses full Unicode case folding when case-insensitive"""
+        assert match_string("STRASSE", "Die Straße") is True
+        assert match_string("straße", "STRASSE", exact_match=True) is True
+        assert match_string("straße", "STRASSE", case_sensitive=True) is False
+    
     def test_match_string_regex_basic(self):
         """Test match_string with basic regex"""
         assert match_string(r"\d+", "test 123", regex=True) is True
@@ -135,6 +142,12 @@ class TestMatchString:
         assert match_string(r"\d+", "abc 123 xyz", regex=True, exact_match=True) is False
         assert match_string(r"[a-z]+", "hello", regex=True, exact_match=True) is True
     
+    def test_match_string_regex_exact_match_alternation(self):
+        """Test match_string with regex exact_match applies to the whole alternation"""
+        assert match_string(r"a|b", "b", regex=True, exact_match=True) is True
+        assert match_string(r"a|b", "ab", regex=True, exact_match=True) is False
+        assert match_string(r"\d+", "123\n", regex=True, exact_match=True) is False
+    
     def test_match_string_regex_case_insensitive(self):
         """Test match_string with regex and case insensitive"""
         assert match_string(r"test", "This is a TEST", regex=True, case_sensitive=False) is True
@@ -214,3 +227,54 @@ class TestMatchString:
         """Test match_string with prepare_search_value=True and regex=False raises ValueError"""
         with pytest.raises(ValueError, match="prepare_search_value can only be used when regex=True"):
             match_string("test.com", "visit test.com", regex=False, prepare_search_value=True)
+
+
+class TestMatchStringMany:
+    """Test cases for match_string_many function"""
+    
+    def test_match_string_many_substring(self):
+        """Test match_string_many with case-insensitive substring matching"""
+        assert match_string_many(["test", "xyz", "THIS"], "This is a test") == [True, False, True]
+    
+    def test_match_string_many_exact_match(self):
+        """Test match_string_many with exact_match=True"""
+        assert match_string_many(["TEST", "testing"], "test", exact_match=True) == [True, False]
+    
+    def test_match_string_many_case_sensitive(self):
+        """Test match_string_many with case_sensitive=True"""
+        assert match_string_many(["Test", "test"], "test", case_sensitive=True) == [False, True]
+    
+    def test_match_string_many_regex(self):
+        """Test match_string_many with regex patterns"""
+        assert match_string_many([r"\d+", r"[invalid", "test.com"], "visit test.com 123", regex=True) == [True, False, True]
+        assert match_string_many(["test.com"], "visit testXcom", regex=True, prepare_search_value=True) == [False]
+    
+    def test_match_string_many_regex_exact_and_case(self):
+        """Test match_string_many regex mode with exact_match and case_sensitive"""
+        patterns = [r"\d+", r"[a-z]+", r"HELLO"]
+        assert match_string_many(patterns, "hello", regex=True, exact_match=True) == [False, True, True]
+        assert match_string_many(patterns, "hello", regex=True, exact_match=True, case_sensitive=True) == [False, True, False]
+        assert match_string_many(["test<regex>\\d+</regex>end"], "test123end", regex=True, prepare_search_value=True) == [True]
+    
+    def test_match_string_many_matches_match_string(self):
+        """Test match_string_many agrees with match_string for each search value"""
+        values = ["", "hello", "HELLO WORLD", "straße", "o w"]
+        comparison = "Hello World"
+        for exact_match in (False, True):
+            expected = [match_string(value, comparison, exact_match=exact_match) for value in values]
+            assert match_string_many(values, comparison, exact_match=exact_match) == expected
+    
+    def test_match_string_many_empty_list(self):
+        """Test match_string_many with no search values returns empty list"""
+        assert match_string_many([], "test") == []
+    
+    def test_match_string_many_invalid_input(self):
+        """Test match_string_many with non-string inputs raises ValueError"""
+        with pytest.raises(ValueError, match="comparison must be a string"):
+            match_string_many(["test"], None) # type: ignore
+        
+        with pytest.raises(ValueError, match="search_value must be a string"):
+            match_string_many(["test", 123], "test") # type: ignore
+        
+        with pytest.raises(ValueError, match="prepare_search_value can only be used when regex=True"):
+            match_string_many(["test"], "test", prepare_search_value=True)
@@ -1,6 +1,7 @@
 import pytest
 from src.data.text_data import (
-    remove_special_characters
+    remove_special_characters,
+    remove_special_characters_many
 )
 
 
@@ -53,6 +54,12 @@ class TestSpecialCharacterRemoval:
         assert remove_special_characters("") == ""
         assert remove_special_characters("   ") == ""
     
+    def test_remove_special_characters_alphanumeric_unchanged(self):
+        """Test remove_special_characters returns plain alphanumeric text unchanged"""
+        assert remove_special_characters("Hello123") == "Hello123"
+        assert remove_special_characters("Hello123", keep_unicode=False) == "Hello123"
+        assert remove_special_characters("Hello123", normalize_whitespace=False, remove_whitespace=True) == "Hello123"
+    
     def test_remove_special_characters_not_string(self):
         """Test remove_special_characters with non-string input raises ValueError"""
         with pytest.raises(ValueError, match="Input must be a string"):
@@ -92,6 +99,11 @@ class TestSpecialCharacterRemoval:
         assert remove_special_characters("Hello World 123", keep_unicode=False) == "Hello World 123"
         assert remove_special_characters("ABC xyz 789", keep_unicode=False) == "ABC xyz 789"
     
+    def test_remove_special_characters_ascii_only_punctuation(self):
+        """Test remove_special_characters removes ASCII punctuation with keep_unicode=False"""
+        assert remove_special_characters("Hello, World! (test_1)", keep_unicode=False) == "Hello World test1"
+        assert remove_special_characters("a\tb\nc;", keep_unicode=False, normalize_whitespace=False) == "a\tb\nc"
+    
     def test_remove_special_characters_with_special_chars(self):
         """Test remove_special_characters with special characters"""
         assert remove_special_characters("Héllo! Wörld?", keep_unicode=True) == "Héllo Wörld"
@@ -140,3 +152,31 @@ class TestSpecialCharacterRemoval:
         """Test remove_special_characters that normalize_whitespace=False and remove_whitespace=True is valid"""
         result = remove_special_characters("Hello, world!", normalize_whitespace=False, remove_whitespace=True)
         assert result == "Helloworld"
+
+
+class TestSpecialCharacterRemovalMany:
+    """Test cases for remove_special_characters_many function"""
+
+    def test_remove_special_characters_many_basic(self):
+        """Test remove_special_characters_many cleans every string in order"""
+        assert remove_special_characters_many(["Hello, world!", "Price: $19.99!", ""]) == ["Hello world", "Price 1999", ""]
+
+    def test_remove_special_characters_many_matches_single(self):
+        """Test remove_special_characters_many agrees with remove_special_characters"""
+        texts = ["Héllo Wörld", "Café #123", "Tab\t\there", "test_variable", "  Hello  "]
+        for options in ({}, {"keep_unicode": False}, {"normalize_whitespace": False, "remove_whitespace": True}):
+            assert remove_special_characters_many(texts, **options) == [remove_special_characters(text, **options) for text in texts]
+
+    def test_remove_special_characters_many_empty_list(self):
+        """Test remove_special_characters_many with no strings returns empty list"""
+        assert remove_special_characters_many([]) == []
+
+    def test_remove_special_characters_many_not_string(self):
+        """Test remove_special_characters_many with non-string item raises ValueError"""
+        with pytest.raises(ValueError, match="Input must be a string"):
+            remove_special_characters_many(["test", 123]) # type: ignore
+
+    def test_remove_special_characters_many_invalid_options(self):
+        """Test remove_special_characters_many rejects normalize_whitespace with remove_whitespace"""
+        with pytest.raises(ValueError, match="normalize_whitespace cannot be True when remove_whitespace is True"):
+            remove_special_characters_many(["test"], normalize_whitespace=True, remove_whitespace=True)
@@ -1,15 +1,21 @@
 import pytest
 from datetime import datetime, timedelta
+import pandas as pd
 import pytz
 from src.date_time.operations import (
     get_now,
     is_timezone,
     is_timezone_aware,
     add_days_to_date,
+    add_days_to_dates,
     get_month_start_end,
     format_date
 )
 
+_SP_TZ = pytz.timezone("America/Sao_Paulo")
+_NY_TZ = pytz.timezone("America/New_York")
+_UTC = pytz.UTC
+
 
 class TestGetNow:
     """Test cases for get_now function"""
@@ -42,19 +48,23 @@ class TestGetNow:
     
     def test_get_now_add_days_positive(self):
         """Test get_now with positive day offset"""
+        before = datetime.now(_SP_TZ).replace(tzinfo=None)
         result = get_now(add_days=5, as_string=False)
+        after = datetime.now(_SP_TZ).replace(tzinfo=None)
         assert isinstance(result, datetime)
 
-        now = datetime.now(pytz.timezone("America/Sao_Paulo")).replace(tzinfo=None)
-        assert abs((result - now).days - 5) < 1
+        offset = timedelta(days=5)
+        assert before + offset <= result <= after + offset
     
     def test_get_now_add_days_negative(self):
         """Test get_now with negative day offset"""
+        before = datetime.now(_SP_TZ).replace(tzinfo=None)
         result = get_now(add_days=-3, as_string=False)
+        after = datetime.now(_SP_TZ).replace(tzinfo=None)
         assert isinstance(result, datetime)
 
-        now = datetime.now(pytz.timezone("America/Sao_Paulo")).replace(tzinfo=None)
-        assert abs((result - now).days + 3) < 1
+        offset = timedelta(days=-3)
+        assert before + offset <= result <= after + offset
     
     def test_get_now_different_timezone(self):
         """Test get_now with different timezone"""
@@ -96,8 +106,7 @@ class TestIsTimezoneAware:
     
     def test_is_timezone_aware_with_tz(self):
         """Test is_timezone_aware with timezone-aware datetime"""
-        tz = pytz.timezone("America/Sao_Paulo")
-        dt = datetime.now(tz)
+        dt = datetime.now(_SP_TZ)
 
         assert is_timezone_aware(dt) is True
     
@@ -109,7 +118,7 @@ class TestIsTimezoneAware:
     
     def test_is_timezone_aware_utc(self):
         """Test is_timezone_aware with UTC timezone"""
-        dt = datetime.now(pytz.UTC)
+        dt = datetime.now(_UTC)
 
         assert is_timezone_aware(dt) is True
 
@@ -117,115 +126,145 @@ class TestIsTimezoneAware:
 class TestAddDaysToDate:
     """Test cases for add_days_to_date function"""
     
+    BASE_DATE = datetime(2023, 5, 15, 10, 30, 0)
+    BASE_DATE_AWARE = _SP_TZ.localize(datetime(2023, 5, 15, 10, 30, 0))
+    
     def test_add_days_zero(self):
         """Test add_days_to_date with zero days"""
-        base_date = datetime(2023, 5, 15, 10, 30, 0)
-
-        result = add_days_to_date(base_date, add_days=0)
+        result = add_days_to_date(self.BASE_DATE, add_days=0)
 
         assert result == "2023-05-15 10:30:00"
     
     def test_add_days_positive(self):
         """Test add_days_to_date with positive days"""
-        base_date = datetime(2023, 5, 15, 10, 30, 0)
-
-        result = add_days_to_date(base_date, add_days=10)
+        result = add_days_to_date(self.BASE_DATE, add_days=10)
 
         assert result == "2023-05-25 10:30:00"
     
     def test_add_days_negative(self):
         """Test add_days_to_date with negative days"""
-        base_date = datetime(2023, 5, 15, 10, 30, 0)
-
-        result = add_days_to_date(base_date, add_days=-5)
+        result = add_days_to_date(self.BASE_DATE, add_days=-5)
 
         assert result == "2023-05-10 10:30:00"
     
     def test_add_days_custom_format(self):
         """Test add_days_to_date with custom format"""
-        base_date = datetime(2023, 5, 15, 10, 30, 0)
-
-        result = add_days_to_date(base_date, add_days=0, format="%d/%m/%Y")
+        result = add_days_to_date(self.BASE_DATE, add_days=0, format="%d/%m/%Y")
 
         assert result == "15/05/2023"
     
     def test_add_days_return_datetime(self):
         """Test add_days_to_date returns datetime object"""
-        base_date = datetime(2023, 5, 15, 10, 30, 0)
-
-        result = add_days_to_date(base_date, add_days=3, as_string=False)
+        result = add_days_to_date(self.BASE_DATE, add_days=3, as_string=False)
         
         assert isinstance(result, datetime)
-        assert result == base_date + timedelta(days=3)
+        assert result == self.BASE_DATE + timedelta(days=3)
         if isinstance(result, datetime):
             assert result.tzinfo is None
     
     def test_add_days_with_tzinfo(self):
         """Test add_days_to_date preserves timezone info when requested"""
-        tz = pytz.timezone("America/Sao_Paulo")
-        base_date = datetime(2023, 5, 15, 10, 30, 0, tzinfo=tz)
-
-        result = add_days_to_date(base_date, add_days=0, as_string=False, return_tzinfo=True)
+        result = add_days_to_date(self.BASE_DATE_AWARE, add_days=0, as_string=False, return_tzinfo=True)
 
         assert isinstance(result, datetime)
         assert result.tzinfo is not None
     
     def test_add_days_removes_tzinfo_by_default(self):
         """Test add_days_to_date removes timezone info by default"""
-        tz = pytz.timezone("America/Sao_Paulo")
-        base_date = datetime(2023, 5, 15, 10, 30, 0, tzinfo=tz)
-        
-        result = add_days_to_date(base_date, add_days=0, as_string=False, return_tzinfo=False)
+        result = add_days_to_date(self.BASE_DATE_AWARE, add_days=0, as_string=False, return_tzinfo=False)
         
         assert isinstance(result, datetime)
         if isinstance(result, datetime):
             assert result.tzinfo is None
 
 
-class TestGetMonthStartEnd:
-    """Test cases for get_month_start_end function"""
+class TestAddDaysToDates:
+    """Test cases for add_days_to_dates function"""
     
-    def test_get_month_start_end_january(self):
-        """Test get_month_start_end for January (31 days)"""
-        start, end = get_month_start_end(2023, 1)
+    BASE_DATE = datetime(2023, 5, 15, 10, 30, 0)
+    
+    def test_add_days_to_dates_strings(self):
+        """Test add_days_to_dates formats every shifted date"""
+        dates = [self.BASE_DATE, datetime(2023, 12, 31, 23, 0, 0)]
+
+        result = add_days_to_dates(dates, add_days=1)
 
-        assert start == "2023-01-01"
-        assert end == "2023-01-31"
+        assert result.tolist() == ["2023-05-16 10:30:00", "2024-01-01 23:00:00"]
     
-    def test_get_month_start_end_february_regular(self):
-        """Test get_month_start_end for February in non-leap year"""
-        start, end = get_month_start_end(2023, 2)
+    def test_add_days_to_dates_matches_scalar(self):
+        """Test add_days_to_dates agrees with add_days_to_date for each value"""
+        dates = [self.BASE_DATE + timedelta(hours=7 * i) for i in range(50)]
+
+        result = add_days_to_dates(dates, add_days=-5, format="%d/%m/%Y %H:%M")
 
-        assert start == "2023-02-01"
-        assert end == "2023-02-28"
+        assert result.tolist() == [add_days_to_date(date, add_days=-5, format="%d/%m/%Y %H:%M") for date in dates]
     
-    def test_get_month_start_end_february_leap(self):
-        """Test get_month_start_end for February in leap year"""
-        start, end = get_month_start_end(2024, 2)
+    def test_add_days_to_dates_large(self):
+        """Test add_days_to_dates on a large sorted input keeps order and offset"""
+        dates = [self.BASE_DATE + timedelta(minutes=i) for i in range(10_000)]
 
-        assert start == "2024-02-01"
-        assert end == "2024-02-29"
+        result = add_days_to_dates(dates, add_days=3, as_string=False)
+
+        assert len(result) == 10_000
+        assert result.is_monotonic_increasing
+        assert result.iloc[0] == self.BASE_DATE + timedelta(days=3)
+        assert result.iloc[-1] == dates[-1] + timedelta(days=3)
     
-    def test_get_month_start_end_april(self):
-        """Test get_month_start_end for April (30 days)"""
-        start, end = get_month_start_end(2023, 4)
+    def test_add_days_to_dates_preserves_series_index(self):
+        """Test add_days_to_dates keeps the index of an input Series"""
+        dates = pd.Series([self.BASE_DATE, self.BASE_DATE], index=["a", "b"])
+
+        result = add_days_to_dates(dates, add_days=0, format="%Y-%m-%d")
 
-        assert start == "2023-04-01"
-        assert end == "2023-04-30"
+        assert list(result.index) == ["a", "b"]
+        assert result.tolist() == ["2023-05-15", "2023-05-15"]
     
-    def test_get_month_start_end_december(self):
-        """Test get_month_start_end for December (31 days)"""
-        start, end = get_month_start_end(2023, 12)
+    def test_add_days_to_dates_tzinfo(self):
+        """Test add_days_to_dates drops timezone by default and keeps it when requested"""
+        dates = [_SP_TZ.localize(self.BASE_DATE)]
 
-        assert start == "2023-12-01"
-        assert end == "2023-12-31"
+        naive = add_days_to_dates(dates, add_days=2, as_string=False)
+        aware = add_days_to_dates(dates, add_days=2, as_string=False, return_tzinfo=True)
+
+        assert naive.dt.tz is None
+        assert naive.iloc[0] == datetime(2023, 5, 17, 10, 30, 0)
+        assert str(aware.dt.tz) == "America/Sao_Paulo"
+        assert aware.iloc[0] == _SP_TZ.localize(datetime(2023, 5, 17, 10, 30, 0))
     
-    def test_get_month_start_end_custom_format(self):
-        """Test get_month_start_end with custom format"""
-        start, end = get_month_start_end(2023, 5, format="%d/%m/%Y")
+    @pytest.mark.parametrize("date,add_days", [
+        (_SP_TZ.localize(datetime(2024, 1, 10, 8, 0, 0)), 1),
+        (_NY_TZ.localize(datetime(2024, 3, 9, 2, 30, 0)), 1),    # lands in the spring-forward gap
+        (_NY_TZ.localize(datetime(2024, 11, 2, 1, 30, 0)), 1),   # lands in the fall-back overlap
+        (_NY_TZ.localize(datetime(2024, 1, 10, 12, 0, 0)), 90),  # crosses into daylight time
+    ], ids=["sao_paulo", "dst_gap", "dst_overlap", "dst_crossing"])
+    def test_add_days_to_dates_matches_scalar_with_timezone(self, date, add_days):
+        """Test add_days_to_dates agrees with add_days_to_date on %z/%Z output and aware results"""
+        format = "%Y-%m-%d %H:%M %z %Z"
+
+        strings = add_days_to_dates([date], add_days=add_days, format=format)
+        aware = add_days_to_dates([date], add_days=add_days, as_string=False, return_tzinfo=True)
 
-        assert start == "01/05/2023"
-        assert end == "31/05/2023"
+        assert strings.iloc[0] == add_days_to_date(date, add_days=add_days, format=format)
+        assert aware.iloc[0] == add_days_to_date(date, add_days=add_days, as_string=False, return_tzinfo=True)
+
+
+class TestGetMonthStartEnd:
+    """Test cases for get_month_start_end function"""
+    
+    @pytest.mark.parametrize("year,month,format,expected_start,expected_end", [
+        (2023, 1, "%Y-%m-%d", "2023-01-01", "2023-01-31"),   # January (31 days)
+        (2023, 2, "%Y-%m-%d", "2023-02-01", "2023-02-28"),   # February in non-leap year
+        (2024, 2, "%Y-%m-%d", "2024-02-01", "2024-02-29"),   # February in leap year
+        (2023, 4, "%Y-%m-%d", "2023-04-01", "2023-04-30"),   # April (30 days)
+        (2023, 12, "%Y-%m-%d", "2023-12-01", "2023-12-31"),  # December (31 days)
+        (2023, 5, "%d/%m/%Y", "01/05/2023", "31/05/2023"),   # Custom format
+    ])
+    def test_get_month_start_end(self, year, month, format, expected_start, expected_end):
+        """Test get_month_start_end string output across month lengths and formats"""
+        start, end = get_month_start_end(year, month, format=format)
+
+        assert start == expected_start
+        assert end == expected_end
     
     def test_get_month_start_end_as_datetime(self):
         """Test get_month_start_end returns datetime objects"""
@@ -246,45 +285,33 @@ class TestFormatDate:
 
         assert result == "2023-05-15 14:30:11"
     
-    def test_format_date_custom_formats(self):
-        """Test format_date with custom formats"""
-        result = format_date("2023-05-15", original_format="%Y-%m-%d", new_format="%d/%m/%Y")
-
-        assert result == "15/05/2023"
-    
-    def test_format_date_custom_formats_with_time(self):
-        """Test format_date with time components"""
-        result = format_date(
-            "2023-05-15 14:30:45",
-            original_format="%Y-%m-%d %H:%M:%S",
-            new_format="%d/%m/%Y %H:%M:%S"
-        )
-        assert result == "15/05/2023 14:30:45"
-    
-    def test_format_date_to_simple_date(self):
-        """Test format_date converting to simple date format"""
-        result = format_date(
-            "2023-05-15 14:30:45",
-            original_format="%Y-%m-%d %H:%M:%S",
-            new_format="%Y-%m-%d"
-        )
-        assert result == "2023-05-15"
-    
-    def test_format_date_different_separators(self):
-        """Test format_date with different separators"""
-        result = format_date(
-            "15-05-2023",
-            original_format="%d-%m-%Y",
-            new_format="%d.%m.%Y"
-        )
-        assert result == "15.05.2023"
-    
-    def test_format_date_invalid_date_raises_error(self):
-        """Test format_date raises error for invalid date string"""
-        with pytest.raises(ValueError):
-            format_date("invalid-date", original_format="%Y-%m-%d")
-
-    def test_format_date_invalid_format_raises_error(self):
-        """Test format_date raises error for invalid date string"""
+    @pytest.mark.parametrize("date_string,original_format,new_format,expected", [
+        ("2023-05-15", "%Y-%m-%d", "%d/%m/%Y", "15/05/2023"),                                     # Custom formats
+        ("2023-05-15 14:30:45", "%Y-%m-%d %H:%M:%S", "%d/%m/%Y %H:%M:%S", "15/05/2023 14:30:45"),  # With time components
+        ("2023-05-15 14:30:45", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "2023-05-15"),                    # To simple date
+        ("15-05-2023", "%d-%m-%Y", "%d.%m.%Y", "15.05.2023"),                                     # Different separators
+    ])
+    def test_format_date_custom_formats(self, date_string, original_format, new_format, expected):
+        """Test format_date with custom original and target formats"""
+        result = format_date(date_string, original_format=original_format, new_format=new_format)
+
+        assert result == expected
+    
+    @pytest.mark.parametrize("new_format", ["%B %d, %Y", "{%d}/%m", "%%Y %Y", "%Y%m%d%H%M%S"])
+    def test_format_date_matches_strftime(self, new_format):
+        """Test format_date output matches strftime for mixed and literal directives"""
+        expected = datetime(2023, 5, 15, 14, 30, 45).strftime(new_format)
+
+        # Repeat the call so the cached formatter is exercised
+        for _ in range(2):
+            result = format_date("2023-05-15 14:30:45", original_format="%Y-%m-%d %H:%M:%S", new_format=new_format)
+            assert result == expected
+    
+    @pytest.mark.parametrize("date_string,original_format", [
+        ("invalid-date", "%Y-%m-%d"),        # Invalid date string
+        ("15-05-2023", "invalid-format"),    # Invalid format
+    ])
+    def test_format_date_invalid_input_raises_error(self, date_string, original_format):
+        """Test format_date raises error when the date string does not match the format"""
         with pytest.raises(ValueError):
-            format_date("15-05-2023", original_format="invalid-format")
+            format_date(date_string, original_format=original_format)
@@ -1,9 +1,69 @@
 import pytest
 import pandas as pd
-from src.db import DatabaseFactory, create_connection, DatabaseConnection, SQLiteConnection, MySQLConnection
+from src.db import DatabaseFactory, create_connection, DatabaseConnection, SQLiteConnection
 from src.error import DatabaseError
 
 
+_EMPTY = pd.DataFrame()
+
+
+class CustomDBConnection(DatabaseConnection):
+    """Mock custom database connector."""
+    
+    def __init__(self, connection_string: str, primary_key_column: str | None = None):
+        super().__init__(primary_key_column)
+        self.connection_string = connection_string
+    
+    def _connect_db(self, **kwargs):
+        return None, None
+    
+    def _disconnect_db(self):
+        pass
+    
+    def _rollback(self):
+        pass
+    
+    def is_connected(self):
+        return False
+    
+    def select(self, table_name, columns=None, filters=None, order_by=None, limit=None, dtype=None, parse_dates=None, localize_timezone=None):
+        return _EMPTY
+    
+    def insert(self, table_name, rows, return_inserted=True, dtype=None, parse_dates=None, localize_timezone=None):
+        return None
+    
+    def update(self, table_name, parameters, filters, return_updated_rows=True, dtype=None, parse_dates=None, localize_timezone=None):
+        return None
+    
+    def delete(self, table_name, filters):
+        return 0
+    
+    def execute(self, sql, params=None, commit=True):
+        return None
+    
+    def table_exists(self, table_name):
+        return False
+    
+    def get_table_info(self, table_name):
+        return _EMPTY
+
+
+class DuplicateConnection(DatabaseConnection):
+    """Minimal connector used to test duplicate registration."""
+    
+    def _connect_db(self, **kwargs): pass # type: ignore
+    def _disconnect_db(self): pass
+    def _rollback(self): pass
+    def is_connected(self): return False
+    def select(self, *args, **kwargs): return _EMPTY
+    def insert(self, *args, **kwargs): return None
+    def update(self, *args, **kwargs): return None
+    def delete(self, *args, **kwargs): return 0
+    def execute(self, *args, **kwargs): return None
+    def table_exists(self, *args, **kwargs): return False
+    def get_table_info(self, *args, **kwargs): return _EMPTY
+
+
 class TestDatabaseFactory:
     """Test suite for DatabaseFactory class."""
     
@@ -20,23 +80,23 @@ class TestDatabaseFactory:
         assert DatabaseFactory.is_supported("mongodb") is False
         assert DatabaseFactory.is_supported("invalid") is False
     
-    def test_create_sqlite_connection(self, tmp_path):
+    def test_create_sqlite_connection(self):
         """Test creating SQLite connection through factory."""
-        db_path = tmp_path / "test.db"
-
         db = DatabaseFactory.create_connection(
             db_type="sqlite",
-            db_path=str(db_path),
+            db_path=":memory:",
             primary_key_column="id"
         )
         
         assert isinstance(db, SQLiteConnection)
         assert isinstance(db, DatabaseConnection)
         assert db.primary_key_column == "id"
-        assert db.db_path == db_path
+        assert str(db.db_path) == ":memory:"
 
+    @pytest.mark.slow
     def test_create_mysql_connection(self):
         """Test creating MySQL connection through factory."""
+        from src.db import MySQLConnection
 
         db = DatabaseFactory.create_connection(
             db_type="mysql",
@@ -74,85 +134,39 @@ class TestDatabaseFactory:
     
     def test_register_custom_connector(self):
         """Test registering a custom database connector."""
-        
-        class CustomDBConnection(DatabaseConnection):
-            """Mock custom database connector."""
-            
-            def __init__(self, connection_string: str, primary_key_column: str | None = None):
-                super().__init__(primary_key_column)
-                self.connection_string = connection_string
-            
-            def _connect_db(self, **kwargs):
-                return None, None
-            
-            def _disconnect_db(self):
-                pass
-            
-            def _rollback(self):
-                pass
-            
-            def is_connected(self):
-                return False
-            
-            def select(self, table_name, columns=None, filters=None, order_by=None, limit=None, dtype=None, parse_dates=None, localize_timezone=None):
-                return pd.DataFrame()
-            
-            def insert(self, table_name, rows, return_inserted=True, dtype=None, parse_dates=None, localize_timezone=None):
-                return None
-            
-            def update(self, table_name, parameters, filters, return_updated_rows=True, dtype=None, parse_dates=None, localize_timezone=None):
-                return None
-            
-            def delete(self, table_name, filters):
-                return 0
-            
-            def execute(self, sql, params=None, commit=True):
-                return None
-            
-            def table_exists(self, table_name):
-                return False
-            
-            def get_table_info(self, table_name):
-                return pd.DataFrame()
-        
         # Register custom connector
         DatabaseFactory.register_connector("customdb", CustomDBConnection)
         
-        # Verify registration
-        assert DatabaseFactory.is_supported("customdb")
-        assert "customdb" in DatabaseFactory.get_supported_types()
-        
-        # Create connection using custom connector
-        db = DatabaseFactory.create_connection(
-            db_type="customdb", # type: ignore
-            connection_string="custom://localhost/test"
-        )
-        
-        assert isinstance(db, CustomDBConnection)
-        assert db.connection_string == "custom://localhost/test"
+        try:
+            # Verify registration
+            assert DatabaseFactory.is_supported("customdb")
+            assert "customdb" in DatabaseFactory.get_supported_types()
+            
+            # Create connection using custom connector
+            db = DatabaseFactory.create_connection(
+                db_type="customdb", # type: ignore
+                connection_string="custom://localhost/test"
+            )
+            
+            assert isinstance(db, CustomDBConnection)
+            assert db.connection_string == "custom://localhost/test"
+        finally:
+            # Cleanup: unregister for other tests
+            DatabaseFactory.unregister_connector("customdb")
         
-        # Cleanup: unregister for other tests
-        DatabaseFactory._CONNECTORS.pop("customdb", None)
+        assert not DatabaseFactory.is_supported("customdb")
+        assert "customdb" not in DatabaseFactory.get_supported_types()
     
     def test_register_duplicate_connector(self):
         """Test that registering duplicate connector raises error."""
-        
-        class DuplicateConnection(DatabaseConnection):
-            def _connect_db(self, **kwargs): pass # type: ignore
-            def _disconnect_db(self): pass
-            def _rollback(self): pass
-            def is_connected(self): return False
-            def select(self, *args, **kwargs): return pd.DataFrame()
-            def insert(self, *args, **kwargs): return None
-            def update(self, *args, **kwargs): return None
-            def delete(self, *args, **kwargs): return 0
-            def execute(self, *args, **kwargs): return None
-            def table_exists(self, *args, **kwargs): return False
-            def get_table_info(self, *args, **kwargs): return pd.DataFrame()
-        
         with pytest.raises(ValueError, match="already registered") as exc_info:
             DatabaseFactory.register_connector("sqlite", DuplicateConnection)
     
+    def test_unregister_unknown_connector(self):
+        """Test that unregistering an unknown connector raises error."""
+        with pytest.raises(ValueError, match="is not registered"):
+            DatabaseFactory.unregister_connector("mongodb")
+    
     def test_register_invalid_connector_class(self):
         """Test that registering non-DatabaseConnection class raises error."""
         
@@ -167,24 +181,20 @@ class TestDatabaseFactory:
 class TestCreateConnectionFunction:
     """Test suite for create_connection convenience function."""
     
-    def test_create_connection_convenience(self, tmp_path):
+    def test_create_connection_convenience(self):
         """Test convenience function for creating connections."""
-        db_path = tmp_path / "test.db"
-        
         db = create_connection(
             db_type="sqlite",
-            db_path=str(db_path),
+            db_path=":memory:",
             primary_key_column="id"
         )
         
         assert isinstance(db, SQLiteConnection)
         assert db.primary_key_column == "id"
     
-    def test_create_connection_with_context_manager(self, tmp_path):
+    def test_create_connection_with_context_manager(self):
         """Test convenience function with context manager."""
-        db_path = tmp_path / "test.db"
-        
-        db = create_connection(db_type="sqlite", db_path=str(db_path))
+        db = create_connection(db_type="sqlite", db_path=":memory:")
         
         with db:
             # Create table
@@ -195,13 +205,13 @@ class TestCreateConnectionFunction:
                 )
             """)
             
-            # Insert data
-            db.execute("INSERT INTO test_table (name) VALUES (?)", ("test",))
+            # Insert data in a single multi-row statement
+            db.execute("INSERT INTO test_table (name) VALUES (?), (?), (?)", ("test", "b", "c"))
             
             # Query data
-            df = db.select("test_table")
-            assert len(df) == 1
-            assert df.iloc[0]["name"] == "test"
+            df = db.select("test_table", order_by="id ASC")
+            assert len(df) == 3
+            assert df["name"].tolist() == ["test", "b", "c"]
         
         assert not db.is_connected()
 
@@ -209,10 +219,10 @@ class TestCreateConnectionFunction:
 class TestFactoryIntegration:
     """Integration tests for factory pattern with actual database operations."""
     
-    @pytest.fixture
-    def db(self, tmp_path):
-        """Provide a test database connection."""
-        db_path = tmp_path / "integration_test.db"
+    @pytest.fixture(scope="module")
+    def db(self, tmp_path_factory):
+        """Provide a test database connection shared across the class."""
+        db_path = tmp_path_factory.mktemp("integration") / "integration_test.db"
         db = create_connection(
             db_type="sqlite",
             db_path=str(db_path),
@@ -231,6 +241,13 @@ class TestFactoryIntegration:
         
         return db
     
+    @pytest.fixture(autouse=True)
+    def _clean(self, db):
+        """Empty the users table before each test."""
+        with db:
+            db.execute("DELETE FROM users")
+            db.execute("DELETE FROM sqlite_sequence WHERE name = 'users'")
+    
     def test_full_crud_cycle(self, db):
         """Test complete CRUD cycle using factory-created connection."""
         with db:
@@ -272,18 +289,16 @@ class TestFactoryIntegration:
             db.insert("users", [{"name": "Test User", "email": "test@test.com", "age": 25}])
             
             initial_count = len(db.select("users"))
-        
-        # Try to insert duplicate email (should fail)
-        try:
-            with db:
+            
+            # Try to insert duplicate email (should fail)
+            try:
                 db.insert("users", [
                     {"name": "Another User", "email": "test@test.com", "age": 30}  # Duplicate email
                 ])
-        except DatabaseError:
-            pass  # Expected error
-        
-        # Verify rollback - count should remain the same
-        with db:
+            except DatabaseError:
+                pass  # Expected error
+            
+            # Verify rollback - count should remain the same
             final_count = len(db.select("users"))
             assert final_count == initial_count
             assert db.select("users").iloc[0]["name"] == "Test User"
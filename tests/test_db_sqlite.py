@@ -1,8 +1,9 @@
+import gc
 import pytest
 import sqlite3
+import uuid
 import pandas as pd
 from pathlib import Path
-import shutil
 from datetime import datetime, timezone, timedelta
 
 from src.db.sqlite import SQLiteConnection
@@ -11,18 +12,78 @@ from src.error.database import DatabaseError
 
 @pytest.fixture
 def temp_db_path(tmp_path):
-    """Provide a temporary database path for testing"""
-    path_db = tmp_path / "test.db"
-    yield str(path_db)
+    """Provide a temporary database path for testing
+    
+    Every database a test touches must live under tmp_path (or :memory:) so
+    that pytest -n auto workers never share a file.
+    """
+    return str(tmp_path / "test.db")
+
+
+@pytest.fixture
+def shared_memory_uri():
+    """Provide a unique shared-cache in-memory database URI (requires uri=True on connect)"""
+    return f"file:test_{uuid.uuid4().hex}?mode=memory&cache=shared"
+
+
+_USERS_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        email TEXT,
+        age INTEGER,
+        active INTEGER DEFAULT 1,
+        created_at TEXT
+    )
+"""
+
+
+# Events and orders tables with timestamp columns, created in one executescript call
+_TIMESTAMP_TABLES_DDL = """
+    CREATE TABLE IF NOT EXISTS events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        event_name TEXT NOT NULL,
+        event_date TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT,
+        scheduled_for TEXT,
+        completed_at TEXT
+    );
+    CREATE TABLE IF NOT EXISTS orders (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        order_number TEXT NOT NULL,
+        customer_name TEXT,
+        amount REAL,
+        order_date TEXT NOT NULL,
+        shipped_date TEXT,
+        delivered_date TEXT
+    );
+"""
+
+# Table with various data types stored as TEXT/INTEGER/REAL
+_PRODUCTS_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS products (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        price REAL,
+        quantity INTEGER,
+        is_available INTEGER,
+        rating REAL,
+        sku TEXT,
+        discount_percent REAL,
+        stock_level INTEGER,
+        category_id INTEGER
+    )
+"""
+
+
+def _fetch_rows(db, table_name, **filters):
+    """Read rows straight from the cursor as sqlite3.Row, skipping DataFrame construction"""
+    query = f"SELECT * FROM {table_name}"
+    if filters:
+        query += " WHERE " + " AND ".join(f"{column} = ?" for column in filters)
+    return db.execute(query, tuple(filters.values()), commit=False).fetchall()
 
-    try:
-        if path_db.exists():
-            path_db.unlink()
-        
-        if tmp_path.exists():
-            shutil.rmtree(tmp_path)
-    except Exception:
-        pass
 
 @pytest.fixture
 def db_connection(temp_db_path):
@@ -33,58 +94,117 @@ def db_connection(temp_db_path):
 @pytest.fixture
 def connected_db(temp_db_path):
     """Provide a connected SQLiteConnection instance with a test table"""
-    db = SQLiteConnection(temp_db_path, primary_key_column="id")
+    db = SQLiteConnection(temp_db_path, primary_key_column="id", fast_pragmas=True)
     db._connect_db()
-    db.execute("""
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            email TEXT,
-            age INTEGER,
-            active INTEGER DEFAULT 1,
-            created_at TEXT
-        )
-    """)
+    db.execute(_USERS_TABLE_DDL)
     yield db
     db._disconnect_db()
 
 
+@pytest.fixture(scope="session")
+def schema_db():
+    """Provide one in-memory SQLiteConnection whose users table is created once per session"""
+    db = SQLiteConnection(":memory:", primary_key_column="id")
+    db._connect_db()
+    db.execute(_USERS_TABLE_DDL)
+    yield db
+    db._disconnect_db()
+
+
+@pytest.fixture
+def mem_db(schema_db):
+    """Provide the shared in-memory database reset to an empty users table"""
+    schema_db.db_connection.rollback()
+    leftovers = schema_db.execute(
+        "SELECT type, name FROM sqlite_master "
+        "WHERE type IN ('table', 'index') AND name NOT IN ('users', 'sqlite_sequence') "
+        "AND name NOT LIKE 'sqlite_autoindex_%'",
+        commit=False
+    ).fetchall()
+    for kind, name in leftovers:
+        schema_db.execute(f"DROP {kind.upper()} IF EXISTS {name}")
+    schema_db.execute("DELETE FROM users")
+    schema_db.execute("DELETE FROM sqlite_sequence")
+    return schema_db
+
+
 @pytest.fixture
-def connected_db_with_timestamps(temp_db_path):
-    """Provide a connected SQLiteConnection instance with timestamp test tables"""
-    db = SQLiteConnection(temp_db_path, primary_key_column="id")
+def no_gc():
+    """Pause the cyclic garbage collector for the duration of a test"""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    yield
+    if was_enabled:
+        gc.enable()
+
+
+@pytest.fixture(scope="class")
+def failing_connect(class_mocker):
+    """Make sqlite3.connect fail for every test in the requesting class"""
+    return class_mocker.patch("sqlite3.connect", side_effect=sqlite3.Error("Connection failed"))
+
+
+@pytest.fixture
+def seed_users(mem_db):
+    """Provide a helper that inserts (name, email, age, active) user rows in one transaction"""
+    def _seed(rows):
+        with mem_db.db_connection:
+            mem_db.db_connection.executemany(
+                "INSERT INTO users (name, email, age, active) VALUES (?, ?, ?, ?)", rows
+            )
+    return _seed
+
+
+@pytest.fixture
+def constraint_db(mem_db):
+    """Provide the in-memory database with a seeded test_unique table (unique email)"""
+    mem_db.db_connection.executescript("""
+        CREATE TABLE test_unique (id INTEGER PRIMARY KEY, email TEXT UNIQUE NOT NULL);
+        INSERT INTO test_unique (email) VALUES ('test@test.com');
+    """)
+    return mem_db
+
+
+@pytest.fixture
+def alice_and_bob(seed_users):
+    """Seed Alice (30) and Bob (25), both active with emails"""
+    seed_users([
+        ("Alice", "alice@test.com", 30, 1),
+        ("Bob", "bob@test.com", 25, 1),
+    ])
+
+
+@pytest.fixture
+def three_users(seed_users):
+    """Seed the canonical Alice/Bob/Charlie users (Bob has no email, Charlie is inactive)"""
+    seed_users([
+        ("Alice", "alice@test.com", 30, 1),
+        ("Bob", None, 25, 1),
+        ("Charlie", "charlie@test.com", 30, 0),
+    ])
+
+
+@pytest.fixture(scope="class")
+def connected_db_with_timestamps():
+    """Provide one connected in-memory SQLiteConnection with timestamp test tables per test class"""
+    db = SQLiteConnection(":memory:", primary_key_column="id")
     db._connect_db()
     
-    # Create table with various timestamp columns
-    db.execute("""
-        CREATE TABLE IF NOT EXISTS events (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            event_name TEXT NOT NULL,
-            event_date TEXT,
-            created_at TEXT NOT NULL,
-            updated_at TEXT,
-            scheduled_for TEXT,
-            completed_at TEXT
-        )
-    """)
-    
-    # Create table for orders with timestamp tracking
-    db.execute("""
-        CREATE TABLE IF NOT EXISTS orders (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            order_number TEXT NOT NULL,
-            customer_name TEXT,
-            amount REAL,
-            order_date TEXT NOT NULL,
-            shipped_date TEXT,
-            delivered_date TEXT
-        )
-    """)
+    db.db_connection.executescript(_TIMESTAMP_TABLES_DDL)
     
     yield db
     db._disconnect_db()
 
 
+@pytest.fixture(scope="session")
+def products_template():
+    """Provide an in-memory database holding the products schema, built once per session"""
+    template = sqlite3.connect(":memory:")
+    template.execute(_PRODUCTS_TABLE_DDL)
+    yield template
+    template.close()
+
+
 class TestSQLiteConnectionInit:
     """Test cases for SQLiteConnection initialization"""
     
@@ -96,6 +216,10 @@ class TestSQLiteConnectionInit:
         assert db.db_connection is None
         assert db.db_cursor is None
     
+    def test_init_fast_pragmas_default_off(self, temp_db_path):
+        """Test fast PRAGMAs are opt-in"""
+        assert SQLiteConnection(temp_db_path).fast_pragmas is False
+    
     def test_init_with_primary_key(self, temp_db_path):
         """Test initialization with primary key column"""
         db = SQLiteConnection(temp_db_path, primary_key_column="id")
@@ -124,33 +248,19 @@ class TestSQLiteConnectionContextManager:
         # After exiting, connection should be closed
         assert not db.is_connected()
     
-    def test_context_manager_rollback_on_error(self, temp_db_path):
+    def test_context_manager_rollback_on_error(self, connected_db, temp_db_path):
         """Test context manager rolls back on error"""
-        db = SQLiteConnection(temp_db_path, primary_key_column="id")
-        db._connect_db()
-        db.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                email TEXT
-            )
-        """)
-        db.execute("INSERT INTO users (name, email) VALUES ('Test', 'test@example.com')")
-        db._disconnect_db()
+        connected_db.execute("INSERT INTO users (name, email) VALUES (?, ?)", ("Test", "test@example.com"))
         
-        try:
+        with pytest.raises(ValueError, match="Simulated error"):
             with SQLiteConnection(temp_db_path) as db2:
-                # execute() commits automatically by default
-                db2.execute("INSERT INTO users (name, email) VALUES ('Test2', 'test2@example.com')", commit=False)
+                db2.execute("INSERT INTO users (name, email) VALUES (?, ?)", ("Test2", "test2@example.com"), commit=False)
                 raise ValueError("Simulated error")
-        except ValueError:
-            pass
         
-        # Reconnect and check - the second insert should be rolled back
-        with SQLiteConnection(temp_db_path) as db3:
-            result = db3.select("users")
-            assert len(result) == 1
-            assert result.iloc[0]["name"] == "Test"
+        # The fixture's connection stays open and sees only the committed row
+        result = _fetch_rows(connected_db, "users")
+        assert len(result) == 1
+        assert result[0]["name"] == "Test"
 
 
 class TestSQLiteConnectionConnect:
@@ -173,6 +283,13 @@ class TestSQLiteConnectionConnect:
         result = cursor.fetchone()
         assert result[0] == 1  # Foreign keys enabled
     
+    def test_connect_db_applies_fast_pragmas(self, connected_db):
+        """Test fast_pragmas switches the database to WAL with relaxed sync"""
+        connection = connected_db.db_connection
+        
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert connection.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    
     def test_connect_db_sets_row_factory(self, db_connection):
         """Test _connect_db sets row factory to sqlite3.Row"""
         db_connection._connect_db()
@@ -189,30 +306,61 @@ class TestSQLiteConnectionConnect:
         
         assert first_connection is second_connection
     
-    def test_connect_db_with_different_isolation_levels(self, db_connection):
+    @pytest.mark.parametrize("level", ["IMMEDIATE", "EXCLUSIVE", None])
+    def test_connect_db_with_different_isolation_levels(self, db_connection, level):
         """Test _connect_db with different isolation levels"""
-        # Test IMMEDIATE
-        db_connection._connect_db(isolation_level="IMMEDIATE")
-        assert db_connection.db_connection.isolation_level == "IMMEDIATE"
-        db_connection._disconnect_db()
+        db_connection._connect_db(isolation_level=level)
+        assert db_connection.db_connection.isolation_level == level
+    
+    def test_connect_db_forwards_connect_kwargs(self, db_connection, mocker):
+        """Test _connect_db passes extra keyword arguments to sqlite3.connect"""
+        spy = mocker.spy(sqlite3, "connect")
         
-        # Test EXCLUSIVE
-        db_connection._connect_db(isolation_level="EXCLUSIVE")
-        assert db_connection.db_connection.isolation_level == "EXCLUSIVE"
-        db_connection._disconnect_db()
+        db_connection._connect_db(cached_statements=64)
         
-        # Test None (autocommit)
-        db_connection._connect_db(isolation_level=None)
-        assert db_connection.db_connection.isolation_level is None
+        assert spy.call_args.kwargs["cached_statements"] == 64
     
-    def test_connect_db_error_handling(self, mocker):
-        """Test _connect_db raises DatabaseError on connection failure"""
-        # Mock sqlite3.connect to raise an error
-        mocker.patch("sqlite3.connect", side_effect=sqlite3.Error("Connection failed"))
+    def test_connect_db_enlarges_statement_cache(self, db_connection, mocker):
+        """Test _connect_db sizes the prepared statement cache by default"""
+        spy = mocker.spy(sqlite3, "connect")
         
+        db_connection._connect_db()
+        
+        assert spy.call_args.kwargs["cached_statements"] == 256
+    
+    def test_connect_db_shared_memory_uri(self, shared_memory_uri):
+        """Test two connections opened with uri=True share one in-memory database"""
+        writer = SQLiteConnection(shared_memory_uri, primary_key_column="id")
+        reader = SQLiteConnection(shared_memory_uri)
+        try:
+            writer._connect_db(uri=True)
+            writer.execute(_USERS_TABLE_DDL)
+            writer.execute("INSERT INTO users (name) VALUES (?)", ("Alice",))
+            
+            reader._connect_db(uri=True)
+            assert _fetch_rows(reader, "users")[0]["name"] == "Alice"
+        finally:
+            reader._disconnect_db()
+            writer._disconnect_db()
+
+
+@pytest.mark.usefixtures("failing_connect")
+class TestSQLiteConnectionFailures:
+    """Test cases for connection failures, sharing one sqlite3.connect patch"""
+    
+    def test_connect_db_error_handling(self):
+        """Test _connect_db raises DatabaseError on connection failure"""
         db = SQLiteConnection("/invalid/path/db.db")
         with pytest.raises(DatabaseError, match="Failed to connect to database"):
             db._connect_db()
+    
+    def test_context_manager_connection_error(self):
+        """Test entering the context manager surfaces the connection failure"""
+        with pytest.raises(DatabaseError) as exc_info:
+            with SQLiteConnection("/invalid/path/db.db"):
+                pass
+        
+        assert exc_info.value.code == "CONNECTION_ERROR"
 
 
 class TestSQLiteConnectionDisconnect:
@@ -235,20 +383,28 @@ class TestSQLiteConnectionDisconnect:
 class TestSQLiteConnectionValidation:
     """Test cases for identifier validation"""
     
-    def test_is_valid_identifier(self):
+    @pytest.mark.parametrize("identifier,valid", [
+        ("table_name", True),
+        ("_private", True),
+        ("Column1", True),
+        ("user_id_123", True),
+        ("123invalid", False),
+        ("table-name", False),
+        ("drop; table", False),
+        ("user.id", False),
+        ("", False),
+    ])
+    def test_is_valid_identifier(self, identifier, valid):
         """Test _is_valid_identifier validates SQL identifiers correctly"""
-        # Valid identifiers
-        assert SQLiteConnection._is_valid_identifier("table_name")
-        assert SQLiteConnection._is_valid_identifier("_private")
-        assert SQLiteConnection._is_valid_identifier("Column1")
-        assert SQLiteConnection._is_valid_identifier("user_id_123")
-        
-        # Invalid identifiers
-        assert not SQLiteConnection._is_valid_identifier("123invalid")
-        assert not SQLiteConnection._is_valid_identifier("table-name")
-        assert not SQLiteConnection._is_valid_identifier("drop; table")
-        assert not SQLiteConnection._is_valid_identifier("user.id")
-        assert not SQLiteConnection._is_valid_identifier("")
+        assert SQLiteConnection._is_valid_identifier(identifier) is valid
+    
+    def test_is_valid_identifier_is_cached(self):
+        """Test repeated identifiers are served from the validation cache"""
+        SQLiteConnection._is_valid_identifier("users")
+        hits_before = SQLiteConnection._is_valid_identifier.cache_info().hits
+        
+        assert SQLiteConnection._is_valid_identifier("users")
+        assert SQLiteConnection._is_valid_identifier.cache_info().hits == hits_before + 1
     
     def test_validate_identifiers_valid(self, db_connection):
         """Test _validate_identifiers with valid identifiers"""
@@ -277,127 +433,88 @@ class TestSQLiteConnectionIsConnected:
         assert not connected_db.is_connected()
 
 
+@pytest.mark.usefixtures("no_gc")
 class TestSQLiteConnectionSelect:
     """Test cases for select method"""
     
-    def test_select_all_columns(self, connected_db):
+    def test_select_all_columns(self, mem_db, three_users):
         """Test select with all columns"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Bob', 'bob@test.com', 25)")
-        
-        result = connected_db.select("users")
+        result = mem_db.select("users")
         
-        assert len(result) == 2
+        assert len(result) == 3
         assert "name" in result.columns
         assert "email" in result.columns
         assert "age" in result.columns
     
-    def test_select_specific_columns(self, connected_db):
+    def test_select_specific_columns(self, mem_db):
         """Test select with specific columns"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
+        mem_db.execute("INSERT INTO users (name, email, age) VALUES (?, ?, ?)", ("Alice", "alice@test.com", 30))
         
-        result = connected_db.select("users", columns=["name", "age"])
+        result = mem_db.select("users", columns=["name", "age"])
         
         assert len(result.columns) == 2
         assert "name" in result.columns
         assert "age" in result.columns
         assert "email" not in result.columns
     
-    def test_select_with_filters(self, connected_db):
-        """Test select with filter conditions"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Bob', 'bob@test.com', 25)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Charlie', 'charlie@test.com', 30)")
-        
-        result = connected_db.select("users", filters={"age": 30})
-        
-        assert len(result) == 2
-        assert set(result["name"]) == {"Alice", "Charlie"}
-    
-    def test_select_with_null_filter(self, connected_db):
-        """Test select with NULL filter"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
-        connected_db.execute("INSERT INTO users (name, age) VALUES ('Bob', 25)")
-        
-        result = connected_db.select("users", filters={"email": None})
-        
-        assert len(result) == 1
-        assert result.iloc[0]["name"] == "Bob"
-    
-    def test_select_with_multiple_filters(self, connected_db):
-        """Test select with multiple filter conditions"""
-        connected_db.execute("INSERT INTO users (name, email, age, active) VALUES ('Alice', 'alice@test.com', 30, 1)")
-        connected_db.execute("INSERT INTO users (name, email, age, active) VALUES ('Bob', 'bob@test.com', 30, 0)")
-        connected_db.execute("INSERT INTO users (name, email, age, active) VALUES ('Charlie', 'charlie@test.com', 25, 1)")
-        
-        result = connected_db.select("users", filters={"age": 30, "active": 1})
-        
-        assert len(result) == 1
-        assert result.iloc[0]["name"] == "Alice"
-    
-    def test_select_with_order_by(self, connected_db):
-        """Test select with ORDER BY clause"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Charlie', 'charlie@test.com', 30)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 25)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Bob', 'bob@test.com', 35)")
-        
-        result = connected_db.select("users", order_by="age ASC")
-        
-        assert list(result["name"]) == ["Alice", "Charlie", "Bob"]
-    
-    def test_select_with_limit(self, connected_db):
-        """Test select with LIMIT clause"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Bob', 'bob@test.com', 25)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Charlie', 'charlie@test.com', 35)")
-        
-        result = connected_db.select("users", limit=2)
-        
-        assert len(result) == 2
-    
-    def test_select_with_invalid_limit_negative(self, connected_db):
+    @pytest.mark.parametrize("kwargs,expected", [
+        ({"filters": {"age": 30}}, ["Alice", "Charlie"]),
+        ({"filters": {"email": None}}, ["Bob"]),
+        ({"filters": {"age": 30, "active": 1}}, ["Alice"]),
+        ({"order_by": "age ASC, name"}, ["Bob", "Alice", "Charlie"]),
+        ({"order_by": "age DESC, name", "limit": 2}, ["Alice", "Charlie"]),
+    ], ids=["filter", "null_filter", "multiple_filters", "order_by", "limit"])
+    def test_select_variants(self, mem_db, three_users, kwargs, expected):
+        """Test select filters, ordering and limits against the canonical three users"""
+        result = mem_db.select("users", **kwargs)
+        
+        names = list(result["name"])
+        assert (names if "order_by" in kwargs else sorted(names)) == expected
+    
+    def test_select_with_invalid_limit_negative(self, mem_db):
         """Test select with invalid limit raises ValueError"""
         with pytest.raises(ValueError, match="limit must be a non-negative integer"):
-            connected_db.select("users", limit=-1)
+            mem_db.select("users", limit=-1)
 
-    def test_select_with_invalid_limit_zero(self, connected_db):
+    def test_select_with_invalid_limit_zero(self, mem_db):
         """Test select with invalid limit raises ValueError"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
+        mem_db.execute("INSERT INTO users (name, email, age) VALUES (?, ?, ?)", ("Alice", "alice@test.com", 30))
         
-        result = connected_db.select("users", limit=0)
+        result = mem_db.select("users", limit=0)
 
         assert len(result) == 0
     
-    def test_select_empty_result(self, connected_db):
+    def test_select_empty_result(self, mem_db):
         """Test select returns empty DataFrame when no matches"""
-        result = connected_db.select("users", filters={"name": "NonExistent"})
+        result = mem_db.select("users", filters={"name": "NonExistent"})
         
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 0
     
-    def test_select_with_invalid_table_name(self, connected_db):
+    def test_select_with_invalid_table_name(self, mem_db):
         """Test select with invalid table name raises ValueError"""
         with pytest.raises(ValueError, match="Invalid SQL identifier"):
-            connected_db.select("invalid-table")
+            mem_db.select("invalid-table")
     
-    def test_select_with_invalid_column_name(self, connected_db):
+    def test_select_with_invalid_column_name(self, mem_db):
         """Test select with invalid column name raises ValueError"""
         with pytest.raises(ValueError, match="Invalid SQL identifier"):
-            connected_db.select("users", columns=["name", "bad-column"])
+            mem_db.select("users", columns=["name", "bad-column"])
     
-    def test_select_database_error(self, connected_db):
+    def test_select_database_error(self, mem_db):
         """Test select raises DatabaseError on query execution failure"""
         with pytest.raises(DatabaseError, match="Error executing SELECT"):
-            connected_db.select("nonexistent_table")
+            mem_db.select("nonexistent_table")
 
 
+@pytest.mark.usefixtures("no_gc")
 class TestSQLiteConnectionInsert:
     """Test cases for insert method"""
     
-    def test_insert_single_row(self, connected_db):
+    def test_insert_single_row(self, mem_db):
         """Test insert single row"""
         rows = [{"name": "Alice", "email": "alice@test.com", "age": 30}]
-        result = connected_db.insert("users", rows)
+        result = mem_db.insert("users", rows)
         
         assert len(result) == 1
         assert result.iloc[0]["name"] == "Alice"
@@ -405,45 +522,106 @@ class TestSQLiteConnectionInsert:
         assert result.iloc[0]["age"] == 30
         assert "id" in result.columns
     
-    def test_insert_multiple_rows(self, connected_db):
+    def test_insert_multiple_rows(self, mem_db):
         """Test insert multiple rows"""
         rows = [
             {"name": "Alice", "email": "alice@test.com", "age": 30},
             {"name": "Bob", "email": "bob@test.com", "age": 25},
             {"name": "Charlie", "email": "charlie@test.com", "age": 35}
         ]
-        result = connected_db.insert("users", rows)
+        result = mem_db.insert("users", rows)
         
         assert len(result) == 3
         assert set(result["name"]) == {"Alice", "Bob", "Charlie"}
     
-    def test_insert_with_null_values(self, connected_db):
+    def test_insert_rows_with_different_key_order(self, mem_db):
+        """Test insert matches values to columns when rows list keys in different orders"""
+        rows = [
+            {"name": "Alice", "email": "alice@test.com", "age": 30},
+            {"age": 25, "name": "Bob", "email": "bob@test.com"}
+        ]
+        mem_db.insert("users", rows, return_inserted=False)
+        
+        stored = _fetch_rows(mem_db, "users", name="Bob")
+        assert stored[0]["age"] == 25
+        assert stored[0]["email"] == "bob@test.com"
+    
+    def test_insert_multiple_rows_uses_single_statement(self, mem_db, mocker):
+        """Test a multi-row insert is sent to SQLite as one multi-row INSERT"""
+        cursor = mocker.patch.object(mem_db, "db_cursor", wraps=mem_db.db_cursor)
+        rows = [
+            {"name": "Alice", "email": "alice@test.com", "age": 30},
+            {"name": "Bob", "email": "bob@test.com", "age": 25},
+            {"name": "Charlie", "email": "charlie@test.com", "age": 35}
+        ]
+        mem_db.insert("users", rows, return_inserted=False)
+        
+        insert_calls = [c for c in cursor.execute.call_args_list if c.args[0].startswith("INSERT")]
+        assert len(insert_calls) == 1
+        assert len(insert_calls[0].args[1]) == 9
+    
+    def test_insert_chunks_rows_to_parameter_limit(self, mem_db, mocker):
+        """Test inserts split into several statements when rows exceed the parameter limit"""
+        mocker.patch("src.db.sqlite._MAX_SQL_PARAMETERS", 6)
+        statements = []
+        mem_db.db_connection.set_trace_callback(statements.append)
+        rows = [{"name": f"User{i}", "email": None, "age": i} for i in range(5)]
+        
+        try:
+            result = mem_db.insert("users", rows)
+        finally:
+            mem_db.db_connection.set_trace_callback(None)
+        
+        inserts = [sql for sql in statements if sql.startswith("INSERT")]
+        assert [sql.count("'User") for sql in inserts] == [2, 2, 1]
+        assert list(result["age"]) == [0, 1, 2, 3, 4]
+    
+    def test_insert_returns_rows_after_deleting_highest_id(self, mem_db):
+        """Test inserted rows are returned when AUTOINCREMENT skips a deleted id"""
+        mem_db.insert("users", [{"name": "Alice", "email": None, "age": 30}], return_inserted=False)
+        mem_db.delete("users", filters={"name": "Alice"})
+        
+        result = mem_db.insert("users", [{"name": "Bob", "email": None, "age": 25}])
+        
+        assert len(result) == 1
+        assert result.iloc[0]["name"] == "Bob"
+        assert result.iloc[0]["id"] == 2
+    
+    def test_insert_with_parse_dates_list(self, mem_db):
+        """Test insert accepts parse_dates as a list of columns, like select"""
+        rows = [{"name": "Alice", "email": None, "age": 30, "created_at": "2025-01-15 10:30:00"}]
+        
+        result = mem_db.insert("users", rows, parse_dates=["created_at"])
+        
+        assert result.iloc[0]["created_at"] == pd.Timestamp("2025-01-15 10:30:00")
+    
+    def test_insert_with_null_values(self, mem_db):
         """Test insert with NULL values"""
         rows = [{"name": "Alice", "email": None, "age": 30}]
-        result = connected_db.insert("users", rows)
+        mem_db.insert("users", rows, return_inserted=False)
         
-        assert len(result) == 1
-        assert result.iloc[0]["name"] == "Alice"
-        assert pd.isna(result.iloc[0]["email"])
+        stored = _fetch_rows(mem_db, "users", name="Alice")
+        assert len(stored) == 1
+        assert stored[0]["email"] is None
     
-    def test_insert_without_returning(self, connected_db):
+    def test_insert_without_returning(self, mem_db):
         """Test insert without returning inserted records"""
         rows = [{"name": "Alice", "email": "alice@test.com", "age": 30}]
-        result = connected_db.insert("users", rows, return_inserted=False)
+        result = mem_db.insert("users", rows, return_inserted=False)
         
         assert result is None
         
         # Verify data was inserted
-        db_result = connected_db.select("users")
+        db_result = _fetch_rows(mem_db, "users")
         assert len(db_result) == 1
-        assert db_result.iloc[0]["name"] == "Alice"
+        assert db_result[0]["name"] == "Alice"
     
-    def test_insert_empty_rows(self, connected_db):
+    def test_insert_empty_rows(self, mem_db):
         """Test insert with empty rows list raises ValueError"""
         with pytest.raises(ValueError, match="rows cannot be empty"):
-            connected_db.insert("users", [])
+            mem_db.insert("users", [])
     
-    def test_insert_inconsistent_columns(self, connected_db):
+    def test_insert_inconsistent_columns(self, mem_db):
         """Test insert with inconsistent columns raises ValueError"""
         rows = [
             {"name": "Alice", "email": "alice@test.com"},
@@ -451,70 +629,45 @@ class TestSQLiteConnectionInsert:
         ]
         
         with pytest.raises(ValueError, match="All rows must have the same columns"):
-            connected_db.insert("users", rows)
+            mem_db.insert("users", rows)
     
-    def test_insert_invalid_table_name(self, connected_db):
+    def test_insert_invalid_table_name(self, mem_db):
         """Test insert with invalid table name raises ValueError"""
         rows = [{"name": "Alice"}]
         
         with pytest.raises(ValueError, match="Invalid SQL identifier"):
-            connected_db.insert("invalid-table", rows)
+            mem_db.insert("invalid-table", rows)
     
-    def test_insert_invalid_column_name(self, connected_db):
+    def test_insert_invalid_column_name(self, mem_db):
         """Test insert with invalid column name raises ValueError"""
         rows = [{"bad-column": "value"}]
         
         with pytest.raises(ValueError, match="Invalid SQL identifier"):
-            connected_db.insert("users", rows)
+            mem_db.insert("users", rows)
     
-    def test_insert_constraint_violation(self, connected_db):
+    def test_insert_constraint_violation(self, constraint_db):
         """Test insert with constraint violation raises DatabaseError"""
-        # Create a table with unique constraint
-        connected_db.execute("""
-            CREATE TABLE test_unique (
-                id INTEGER PRIMARY KEY,
-                email TEXT UNIQUE NOT NULL
-            )
-        """)
-        
-        rows = [{"email": "test@test.com"}]
-        connected_db.insert("test_unique", rows, return_inserted=False)
-        
-        # Try to insert duplicate
         with pytest.raises(DatabaseError, match="Error inserting data"):
-            connected_db.insert("test_unique", rows, return_inserted=False)
+            constraint_db.insert("test_unique", [{"email": "test@test.com"}], return_inserted=False)
     
-    def test_insert_rollback_on_error(self, connected_db):
+    def test_insert_rollback_on_error(self, constraint_db):
         """Test insert rolls back on error"""
-        # Try to insert with constraint violation
-        connected_db.execute("""
-            CREATE TABLE test_unique (
-                id INTEGER PRIMARY KEY,
-                email TEXT UNIQUE NOT NULL
-            )
-        """)
-        
-        rows = [{"email": "test@test.com"}]
-        connected_db.insert("test_unique", rows, return_inserted=False)
+        rows = [{"email": "new@test.com"}, {"email": "test@test.com"}]
         
-        # Try to insert duplicate - should rollback
+        # The second row violates the unique constraint, so the whole batch rolls back
         with pytest.raises(DatabaseError):
-            connected_db.insert("test_unique", rows, return_inserted=False)
+            constraint_db.insert("test_unique", rows, return_inserted=False)
         
-        # Verify only one row exists
-        result = connected_db.select("test_unique")
-        assert len(result) == 1
+        assert len(_fetch_rows(constraint_db, "test_unique")) == 1
 
 
+@pytest.mark.usefixtures("no_gc")
 class TestSQLiteConnectionUpdate:
     """Test cases for update method"""
     
-    def test_update_single_field(self, connected_db):
+    def test_update_single_field(self, mem_db, alice_and_bob):
         """Test update single field"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Bob', 'bob@test.com', 25)")
-        
-        result = connected_db.update(
+        result = mem_db.update(
             "users",
             parameters={"age": 31},
             filters={"name": "Alice"}
@@ -524,12 +677,9 @@ class TestSQLiteConnectionUpdate:
         assert result.iloc[0]["age"] == 31
         assert result.iloc[0]["name"] == "Alice"
     
-    def test_update_multiple_fields(self, connected_db):
+    def test_update_multiple_fields(self, mem_db, alice_and_bob):
         """Test update multiple fields"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Bob', 'bob@test.com', 25)")
-        
-        result = connected_db.update(
+        result = mem_db.update(
             "users",
             parameters={"email": "newalice@test.com", "age": 31},
             filters={"name": "Alice"}
@@ -540,28 +690,28 @@ class TestSQLiteConnectionUpdate:
         assert result.iloc[0]["age"] == 31
         assert result.iloc[0]["name"] == "Alice"
     
-    def test_update_with_null_value(self, connected_db):
+    def test_update_with_null_value(self, mem_db, alice_and_bob):
         """Test update field to NULL"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Bob', 'bob@test.com', 25)")
-        
-        result = connected_db.update(
+        mem_db.update(
             "users",
             parameters={"email": None},
-            filters={"name": "Alice"}
+            filters={"name": "Alice"},
+            return_updated_rows=False
         )
         
-        assert len(result) == 1
-        assert pd.isna(result.iloc[0]["email"])
-        assert result.iloc[0]["name"] == "Alice"
+        stored = _fetch_rows(mem_db, "users", name="Alice")
+        assert len(stored) == 1
+        assert stored[0]["email"] is None
     
-    def test_update_multiple_rows(self, connected_db):
+    def test_update_multiple_rows(self, mem_db, seed_users):
         """Test update multiple rows"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Bob', 'bob@test.com', 30)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Charlie', 'charlie@test.com', 35)")
+        seed_users([
+            ("Alice", "alice@test.com", 30, 1),
+            ("Bob", "bob@test.com", 30, 1),
+            ("Charlie", "charlie@test.com", 35, 1),
+        ])
         
-        result = connected_db.update(
+        result = mem_db.update(
             "users",
             parameters={"age": 31},
             filters={"age": 30}
@@ -570,12 +720,14 @@ class TestSQLiteConnectionUpdate:
         assert len(result) == 2
         assert all(result["age"] == 31)
     
-    def test_update_with_null_filter(self, connected_db):
+    def test_update_with_null_filter(self, mem_db, seed_users):
         """Test update with NULL filter"""
-        connected_db.execute("INSERT INTO users (name, age) VALUES ('Alice', 30)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Bob', 'bob@test.com', 30)")
+        seed_users([
+            ("Alice", None, 30, 1),
+            ("Bob", "bob@test.com", 30, 1),
+        ])
         
-        result = connected_db.update(
+        result = mem_db.update(
             "users",
             parameters={"age": 31},
             filters={"email": None}
@@ -585,11 +737,11 @@ class TestSQLiteConnectionUpdate:
         assert result.iloc[0]["name"] == "Alice"
         assert result.iloc[0]["age"] == 31
     
-    def test_update_without_returning(self, connected_db):
+    def test_update_without_returning(self, mem_db):
         """Test update without returning updated records"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
+        mem_db.execute("INSERT INTO users (name, email, age) VALUES (?, ?, ?)", ("Alice", "alice@test.com", 30))
         
-        result = connected_db.update(
+        result = mem_db.update(
             "users",
             parameters={"age": 31},
             filters={"name": "Alice"},
@@ -599,14 +751,14 @@ class TestSQLiteConnectionUpdate:
         assert result is None
         
         # Verify update occurred
-        db_result = connected_db.select("users")
-        assert db_result.iloc[0]["age"] == 31
+        rows = _fetch_rows(mem_db, "users")
+        assert rows[0]["age"] == 31
     
-    def test_update_no_matching_rows(self, connected_db):
+    def test_update_no_matching_rows(self, mem_db):
         """Test update with no matching rows returns empty DataFrame"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
+        mem_db.execute("INSERT INTO users (name, email, age) VALUES (?, ?, ?)", ("Alice", "alice@test.com", 30))
         
-        result = connected_db.update(
+        result = mem_db.update(
             "users",
             parameters={"age": 31},
             filters={"name": "NonExistent"}
@@ -615,119 +767,121 @@ class TestSQLiteConnectionUpdate:
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 0
     
-    def test_update_empty_parameters(self, connected_db):
+    def test_update_empty_parameters(self, mem_db):
         """Test update with empty parameters raises ValueError"""
         with pytest.raises(ValueError, match="parameters and filters cannot be empty"):
-            connected_db.update("users", parameters={}, filters={"name": "Alice"})
+            mem_db.update("users", parameters={}, filters={"name": "Alice"})
     
-    def test_update_empty_filters(self, connected_db):
+    def test_update_empty_filters(self, mem_db):
         """Test update with empty filters raises ValueError"""
         with pytest.raises(ValueError, match="parameters and filters cannot be empty"):
-            connected_db.update("users", parameters={"age": 31}, filters={})
+            mem_db.update("users", parameters={"age": 31}, filters={})
     
-    def test_update_invalid_table_name(self, connected_db):
+    def test_update_invalid_table_name(self, mem_db):
         """Test update with invalid table name raises ValueError"""
         with pytest.raises(ValueError, match="Invalid SQL identifier"):
-            connected_db.update("invalid-table", parameters={"age": 31}, filters={"name": "Alice"})
+            mem_db.update("invalid-table", parameters={"age": 31}, filters={"name": "Alice"})
     
-    def test_update_rollback_on_error(self, connected_db):
+    def test_update_rollback_on_error(self, mem_db):
         """Test update rolls back on error"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
+        mem_db.execute("INSERT INTO users (name, email, age) VALUES (?, ?, ?)", ("Alice", "alice@test.com", 30))
         
         # Create constraint for testing
-        connected_db.execute("CREATE UNIQUE INDEX idx_email_unique ON users(email)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Bob', 'bob@test.com', 25)")
+        mem_db.execute("CREATE UNIQUE INDEX idx_email_unique ON users(email)")
+        mem_db.execute("INSERT INTO users (name, email, age) VALUES (?, ?, ?)", ("Bob", "bob@test.com", 25))
         
         # Try to update to duplicate email - should fail and rollback
         with pytest.raises(DatabaseError):
-            connected_db.update("users", parameters={"email": "alice@test.com"}, filters={"name": "Bob"})
+            mem_db.update("users", parameters={"email": "alice@test.com"}, filters={"name": "Bob"})
         
         # Verify Bob's email was not updated
-        result = connected_db.select("users", filters={"name": "Bob"})
-        assert result.iloc[0]["email"] == "bob@test.com"
+        rows = _fetch_rows(mem_db, "users", name="Bob")
+        assert rows[0]["email"] == "bob@test.com"
 
 
+@pytest.mark.usefixtures("no_gc")
 class TestSQLiteConnectionDelete:
     """Test cases for delete method"""
     
-    def test_delete_single_row(self, connected_db):
+    def test_delete_single_row(self, mem_db, alice_and_bob):
         """Test delete single row"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Bob', 'bob@test.com', 25)")
-        
-        count = connected_db.delete("users", filters={"name": "Alice"})
+        count = mem_db.delete("users", filters={"name": "Alice"})
         
         assert count == 1
         
         # Verify deletion
-        result = connected_db.select("users")
-        assert len(result) == 1
-        assert result.iloc[0]["name"] == "Bob"
+        rows = _fetch_rows(mem_db, "users")
+        assert len(rows) == 1
+        assert rows[0]["name"] == "Bob"
     
-    def test_delete_multiple_rows(self, connected_db):
+    def test_delete_multiple_rows(self, mem_db, seed_users):
         """Test delete multiple rows"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Bob', 'bob@test.com', 30)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Charlie', 'charlie@test.com', 25)")
+        seed_users([
+            ("Alice", "alice@test.com", 30, 1),
+            ("Bob", "bob@test.com", 30, 1),
+            ("Charlie", "charlie@test.com", 25, 1),
+        ])
         
-        count = connected_db.delete("users", filters={"age": 30})
+        count = mem_db.delete("users", filters={"age": 30})
         
         assert count == 2
         
         # Verify deletion
-        result = connected_db.select("users")
-        assert len(result) == 1
-        assert result.iloc[0]["name"] == "Charlie"
+        rows = _fetch_rows(mem_db, "users")
+        assert len(rows) == 1
+        assert rows[0]["name"] == "Charlie"
     
-    def test_delete_with_null_filter(self, connected_db):
+    def test_delete_with_null_filter(self, mem_db, seed_users):
         """Test delete with NULL filter"""
-        connected_db.execute("INSERT INTO users (name, age) VALUES ('Alice', 30)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Bob', 'bob@test.com', 30)")
+        seed_users([
+            ("Alice", None, 30, 1),
+            ("Bob", "bob@test.com", 30, 1),
+        ])
         
-        count = connected_db.delete("users", filters={"email": None})
+        count = mem_db.delete("users", filters={"email": None})
         
         assert count == 1
         
         # Verify deletion
-        result = connected_db.select("users")
-        assert len(result) == 1
-        assert result.iloc[0]["name"] == "Bob"
+        rows = _fetch_rows(mem_db, "users")
+        assert len(rows) == 1
+        assert rows[0]["name"] == "Bob"
     
-    def test_delete_no_matching_rows(self, connected_db):
+    def test_delete_no_matching_rows(self, mem_db):
         """Test delete with no matching rows returns 0"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
+        mem_db.execute("INSERT INTO users (name, email, age) VALUES (?, ?, ?)", ("Alice", "alice@test.com", 30))
         
-        count = connected_db.delete("users", filters={"name": "NonExistent"})
+        count = mem_db.delete("users", filters={"name": "NonExistent"})
         
         assert count == 0
         
         # Verify nothing was deleted
-        result = connected_db.select("users")
-        assert len(result) == 1
-        assert result.iloc[0]["name"] == "Alice"
+        rows = _fetch_rows(mem_db, "users")
+        assert len(rows) == 1
+        assert rows[0]["name"] == "Alice"
     
-    def test_delete_empty_filters(self, connected_db):
+    def test_delete_empty_filters(self, mem_db):
         """Test delete with empty filters raises ValueError"""
         with pytest.raises(ValueError, match="filters cannot be empty"):
-            connected_db.delete("users", filters={})
+            mem_db.delete("users", filters={})
     
-    def test_delete_invalid_table_name(self, connected_db):
+    def test_delete_invalid_table_name(self, mem_db):
         """Test delete with invalid table name raises ValueError"""
         with pytest.raises(ValueError, match="Invalid SQL identifier"):
-            connected_db.delete("invalid-table", filters={"name": "Alice"})
+            mem_db.delete("invalid-table", filters={"name": "Alice"})
     
-    def test_delete_rollback_on_error(self, connected_db):
+    def test_delete_rollback_on_error(self, mem_db):
         """Test delete with invalid table raises DatabaseError"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
+        mem_db.execute("INSERT INTO users (name, email, age) VALUES (?, ?, ?)", ("Alice", "alice@test.com", 30))
         
         # Try to delete from non-existent table
         with pytest.raises(DatabaseError):
-            connected_db.delete("nonexistent_table", filters={"name": "Alice"})
+            mem_db.delete("nonexistent_table", filters={"name": "Alice"})
         
         # Verify user data is still intact
-        result = connected_db.select("users")
-        assert len(result) == 1
-        assert result.iloc[0]["name"] == "Alice"
+        rows = _fetch_rows(mem_db, "users")
+        assert len(rows) == 1
+        assert rows[0]["name"] == "Alice"
 
 
 class TestSQLiteConnectionExecute:
@@ -755,14 +909,14 @@ class TestSQLiteConnectionExecute:
         assert cursor is not None
         
         # Verify insertion
-        result = connected_db.select("users")
+        result = _fetch_rows(connected_db, "users")
         assert len(result) == 1
-        assert result.iloc[0]["name"] == "Alice"
+        assert result[0]["name"] == "Alice"
     
     def test_execute_select_with_params(self, connected_db):
         """Test execute SELECT with parameters"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Bob', 'bob@test.com', 25)")
+        connected_db.execute("INSERT INTO users (name, email, age) VALUES (?, ?, ?)", ("Alice", "alice@test.com", 30))
+        connected_db.execute("INSERT INTO users (name, email, age) VALUES (?, ?, ?)", ("Bob", "bob@test.com", 25))
         
         cursor = connected_db.execute(
             "SELECT * FROM users WHERE age > ?",
@@ -772,6 +926,7 @@ class TestSQLiteConnectionExecute:
         
         results = cursor.fetchall()
         assert len(results) == 1
+        assert isinstance(results[0], sqlite3.Row)
         assert results[0]["name"] == "Alice"
     
     def test_execute_without_commit(self, connected_db, temp_db_path):
@@ -784,22 +939,22 @@ class TestSQLiteConnectionExecute:
         # Should not be visible until commit. This behavior depends on isolation level
         # Open a second connection to verify data is NOT visible yet
         with SQLiteConnection(temp_db_path, primary_key_column="id") as db2:
-            result_not_committed = db2.select("users")
+            result_not_committed = _fetch_rows(db2, "users")
             assert len(result_not_committed) == 0, "Data should not be visible from another connection before commit"
         
         # Now commit the transaction
         connected_db.db_connection.commit()
         
         # Verify data is now visible from the original connection
-        result = connected_db.select("users")
+        result = _fetch_rows(connected_db, "users")
         assert len(result) == 1
-        assert result.iloc[0]["name"] == "Alice"
+        assert result[0]["name"] == "Alice"
 
         # Verify data is also visible from a new connection
         with SQLiteConnection(temp_db_path, primary_key_column="id") as db3:
-            result_new_connection = db3.select("users")
+            result_new_connection = _fetch_rows(db3, "users")
             assert len(result_new_connection) == 1
-            assert result_new_connection.iloc[0]["name"] == "Alice"
+            assert result_new_connection[0]["name"] == "Alice"
     
     def test_execute_error_handling(self, connected_db):
         """Test execute raises DatabaseError on execution failure"""
@@ -808,38 +963,38 @@ class TestSQLiteConnectionExecute:
     
     def test_execute_rollback_on_error_with_commit(self, connected_db, temp_db_path):
         """Test execute rolls back on error when commit=True"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)", commit=True)
+        connected_db.execute("INSERT INTO users (name, email, age) VALUES (?, ?, ?)", ("Alice", "alice@test.com", 30), commit=True)
         
         # Try to execute invalid SQL
         with pytest.raises(DatabaseError, match="Error executing query"):
             connected_db.execute("INVALID SQL COMMAND")
         
         # Verify that the previous insert is still present
-        result = connected_db.select("users")
+        result = _fetch_rows(connected_db, "users")
         assert len(result) == 1
-        assert result.iloc[0]["name"] == "Alice"
+        assert result[0]["name"] == "Alice"
 
         # Verify data is still visible from a new connection
         with SQLiteConnection(temp_db_path, primary_key_column="id") as db2:
-            result_new_connection = db2.select("users")
+            result_new_connection = _fetch_rows(db2, "users")
             assert len(result_new_connection) == 1
-            assert result_new_connection.iloc[0]["name"] == "Alice"
+            assert result_new_connection[0]["name"] == "Alice"
 
     def test_execute_rollback_without_commit(self, connected_db, temp_db_path):
         """Test execute without auto-commit allows rollback"""
         # Insert without committing
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)", commit=False)
+        connected_db.execute("INSERT INTO users (name, email, age) VALUES (?, ?, ?)", ("Alice", "alice@test.com", 30), commit=False)
         
         # Rollback the transaction
         connected_db.db_connection.rollback()
         
         # Verify data was not persisted
-        result = connected_db.select("users")
+        result = _fetch_rows(connected_db, "users")
         assert len(result) == 0, "Data should be rolled back"
 
         # Verify data is not visible from a new connection
         with SQLiteConnection(temp_db_path, primary_key_column="id") as db2:
-            result_new_connection = db2.select("users")
+            result_new_connection = _fetch_rows(db2, "users")
             assert len(result_new_connection) == 0
 
 class TestSQLiteConnectionTableInfo:
@@ -848,7 +1003,7 @@ class TestSQLiteConnectionTableInfo:
     def test_get_table_info(self, connected_db):
         """Test get_table_info returns table schema"""
         # First ensure the users table actually exists with data
-        connected_db.execute("INSERT INTO users (name, email) VALUES ('Test', 'test@test.com')")
+        connected_db.execute("INSERT INTO users (name, email) VALUES (?, ?)", ("Test", "test@test.com"))
         
         info = connected_db.get_table_info("users")
         
@@ -926,40 +1081,40 @@ class TestSQLiteConnectionIntegration:
         )
         
         # Verify update
-        update_result = connected_db.select("users", filters={"id": alice_id})
+        update_result = _fetch_rows(connected_db, "users", id=alice_id)
         assert len(update_result) == 1
-        assert update_result.iloc[0]["name"] == "Alice"
-        assert update_result.iloc[0]["age"] == 31
+        assert update_result[0]["name"] == "Alice"
+        assert update_result[0]["age"] == 31
         
         # Delete
         delete_count = connected_db.delete("users", filters={"id": alice_id})
         assert delete_count == 1
         
         # Verify
-        final_result = connected_db.select("users")
+        final_result = _fetch_rows(connected_db, "users")
         assert len(final_result) == 1
-        assert final_result.iloc[0]["name"] == "Bob"
+        assert final_result[0]["name"] == "Bob"
     
     def test_transaction_rollback(self, connected_db):
         """Test transaction rollback on error"""
-        connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Alice', 'alice@test.com', 30)")
+        connected_db.execute("INSERT INTO users (name, email, age) VALUES (?, ?, ?)", ("Alice", "alice@test.com", 30))
         
         # Create unique constraint
         connected_db.execute("CREATE UNIQUE INDEX idx_email ON users(email)")
         
         try:
             # Start transaction
-            connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Bob', 'bob@test.com', 25)", commit=False)
+            connected_db.execute("INSERT INTO users (name, email, age) VALUES (?, ?, ?)", ("Bob", "bob@test.com", 25), commit=False)
             # This should fail due to duplicate email constraint
-            connected_db.execute("INSERT INTO users (name, email, age) VALUES ('Charlie', 'alice@test.com', 35)", commit=False)
+            connected_db.execute("INSERT INTO users (name, email, age) VALUES (?, ?, ?)", ("Charlie", "alice@test.com", 35), commit=False)
             connected_db.db_connection.commit()
         except DatabaseError:
             connected_db.db_connection.rollback()
         
         # Verify only Alice exists (Bob should be rolled back)
-        result = connected_db.select("users")
+        result = _fetch_rows(connected_db, "users")
         assert len(result) == 1
-        assert result.iloc[0]["name"] == "Alice"
+        assert result[0]["name"] == "Alice"
     
     def test_concurrent_operations_with_context_manager(self, temp_db_path):
         """Test multiple operations using context manager"""
@@ -981,8 +1136,8 @@ class TestSQLiteConnectionIntegration:
             db.insert("products", products, return_inserted=False)
             
             # Query and update
-            result = db.select("products", filters={"name": "Product A"})
-            product_id = int(result.iloc[0]["id"])
+            result = _fetch_rows(db, "products", name="Product A")
+            product_id = result[0]["id"]
             
             # Update the price
             db.update("products", parameters={"price": 12.99}, filters={"id": product_id}, return_updated_rows=False)
@@ -999,15 +1154,23 @@ class TestSQLiteConnectionIntegration:
 class TestSQLiteConnectionTimestamps:
     """Test cases for handling timestamp data in SQLite"""
     
+    @pytest.fixture(autouse=True)
+    def _empty_timestamp_tables(self, connected_db_with_timestamps):
+        """Start each test from empty tables on the class-wide connection"""
+        connected_db_with_timestamps.db_connection.executescript(
+            "DELETE FROM events; DELETE FROM orders; DELETE FROM sqlite_sequence;"
+        )
+    
     def test_insert_timestamp_as_iso_string(self, connected_db_with_timestamps):
         """Test inserting timestamps as ISO 8601 strings"""
         now = datetime.now(timezone.utc)
         iso_timestamp = now.isoformat()
+        event_date = now.strftime("%Y-%m-%d")
         
         rows = [{
             "event_name": "User Login",
             "created_at": iso_timestamp,
-            "event_date": now.strftime("%Y-%m-%d")
+            "event_date": event_date
         }]
         
         result = connected_db_with_timestamps.insert("events", rows)
@@ -1015,28 +1178,31 @@ class TestSQLiteConnectionTimestamps:
         assert len(result) == 1
         assert result.iloc[0]["event_name"] == "User Login"
         assert result.iloc[0]["created_at"] == iso_timestamp
-        assert result.iloc[0]["event_date"] == now.strftime("%Y-%m-%d")
+        assert result.iloc[0]["event_date"] == event_date
     
     def test_insert_multiple_timestamps(self, connected_db_with_timestamps):
         """Test inserting records with multiple timestamp fields"""
         now = datetime.now(timezone.utc)
         future = now + timedelta(days=7)
+        now_iso = now.isoformat()
+        future_iso = future.isoformat()
+        future_date = future.strftime("%Y-%m-%d")
         
         rows = [{
             "event_name": "Conference",
-            "created_at": now.isoformat(),
-            "updated_at": now.isoformat(),
-            "scheduled_for": future.isoformat(),
-            "event_date": future.strftime("%Y-%m-%d")
+            "created_at": now_iso,
+            "updated_at": now_iso,
+            "scheduled_for": future_iso,
+            "event_date": future_date
         }]
         
         result = connected_db_with_timestamps.insert("events", rows)
         
         assert len(result) == 1
-        assert result.iloc[0]["created_at"] == now.isoformat()
-        assert result.iloc[0]["updated_at"] == now.isoformat()
-        assert result.iloc[0]["scheduled_for"] == future.isoformat()
-        assert result.iloc[0]["event_date"] == future.strftime("%Y-%m-%d")
+        assert result.iloc[0]["created_at"] == now_iso
+        assert result.iloc[0]["updated_at"] == now_iso
+        assert result.iloc[0]["scheduled_for"] == future_iso
+        assert result.iloc[0]["event_date"] == future_date
     
     def test_select_with_parse_dates(self, connected_db_with_timestamps):
         """Test selecting records with automatic date parsing"""
@@ -1107,13 +1273,13 @@ class TestSQLiteConnectionTimestamps:
     
     def test_update_timestamp_field(self, connected_db_with_timestamps):
         """Test updating timestamp fields"""
-        initial_time = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
-        updated_time = datetime(2025, 1, 2, 15, 30, 0, tzinfo=timezone.utc)
+        initial_iso = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc).isoformat()
+        updated_iso = datetime(2025, 1, 2, 15, 30, 0, tzinfo=timezone.utc).isoformat()
         
         rows = [{
             "event_name": "Task",
-            "created_at": initial_time.isoformat(),
-            "updated_at": initial_time.isoformat(),
+            "created_at": initial_iso,
+            "updated_at": initial_iso,
             "event_date": "2025-01-01"
         }]
         
@@ -1122,23 +1288,23 @@ class TestSQLiteConnectionTimestamps:
         # Update the timestamp
         result = connected_db_with_timestamps.update(
             "events",
-            parameters={"updated_at": updated_time.isoformat()},
+            parameters={"updated_at": updated_iso},
             filters={"event_name": "Task"}
         )
         
         assert len(result) == 1
-        assert result.iloc[0]["updated_at"] == updated_time.isoformat()
-        assert result.iloc[0]["created_at"] == initial_time.isoformat()  # Unchanged
+        assert result.iloc[0]["updated_at"] == updated_iso
+        assert result.iloc[0]["created_at"] == initial_iso  # Unchanged
     
     def test_update_with_parse_dates(self, connected_db_with_timestamps):
         """Test updating records with automatic date parsing"""
-        initial_time = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
-        updated_time = datetime(2025, 1, 2, 15, 30, 0, tzinfo=timezone.utc)
+        initial_iso = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc).isoformat()
+        updated_iso = datetime(2025, 1, 2, 15, 30, 0, tzinfo=timezone.utc).isoformat()
         
         rows = [{
             "event_name": "Task",
-            "created_at": initial_time.isoformat(),
-            "updated_at": initial_time.isoformat(),
+            "created_at": initial_iso,
+            "updated_at": initial_iso,
             "event_date": "2025-01-01"
         }]
         
@@ -1147,14 +1313,14 @@ class TestSQLiteConnectionTimestamps:
         # Update the timestamp
         result = connected_db_with_timestamps.update(
             "events",
-            parameters={"updated_at": updated_time.isoformat()},
+            parameters={"updated_at": updated_iso},
             filters={"event_name": "Task"},
             parse_dates={"updated_at": "%Y-%m-%dT%H:%M:%S%z"}
         )
         
         assert len(result) == 1
         assert isinstance(result.iloc[0]["updated_at"], pd.Timestamp)
-        assert result.iloc[0]["created_at"] == initial_time.isoformat()
+        assert result.iloc[0]["created_at"] == initial_iso
 
     def test_insert_null_timestamps(self, connected_db_with_timestamps):
         """Test inserting records with NULL timestamps for optional fields"""
@@ -1259,49 +1425,54 @@ class TestSQLiteConnectionTimestamps:
         assert count == 1
         
         # Verify only new event remains
-        result = connected_db_with_timestamps.select("events")
+        result = _fetch_rows(connected_db_with_timestamps, "events")
         assert len(result) == 1
-        assert result.iloc[0]["event_name"] == "New Event"
+        assert result[0]["event_name"] == "New Event"
     
     def test_timestamp_workflow_order_tracking(self, connected_db_with_timestamps):
         """Test complete workflow with order lifecycle timestamps"""
         # Create order
         order_date = datetime(2025, 11, 1, 9, 0, 0, tzinfo=timezone.utc)
+        shipped_date = order_date + timedelta(days=2)
+        delivered_date = shipped_date + timedelta(days=3)
+        order_iso, shipped_iso, delivered_iso = (
+            order_date.isoformat(), shipped_date.isoformat(), delivered_date.isoformat()
+        )
         order = [{
             "order_number": "ORD-12345",
             "customer_name": "John Doe",
             "amount": 199.99,
-            "order_date": order_date.isoformat(),
+            "order_date": order_iso,
             "shipped_date": None,
             "delivered_date": None
         }]
         
-        result = connected_db_with_timestamps.insert("orders", order)
-        order_id = int(result.iloc[0]["id"])
+        connected_db_with_timestamps.insert("orders", order, return_inserted=False)
+        order_id = _fetch_rows(connected_db_with_timestamps, "orders", order_number="ORD-12345")[0]["id"]
         
         # Ship order (update shipped_date)
-        shipped_date = order_date + timedelta(days=2)
         connected_db_with_timestamps.update(
             "orders",
-            parameters={"shipped_date": shipped_date.isoformat()},
+            parameters={"shipped_date": shipped_iso},
             filters={"id": order_id},
             return_updated_rows=False
         )
         
         # Deliver order (update delivered_date)
-        delivered_date = shipped_date + timedelta(days=3)
-        result = connected_db_with_timestamps.update(
+        connected_db_with_timestamps.update(
             "orders",
-            parameters={"delivered_date": delivered_date.isoformat()},
-            filters={"id": order_id}
+            parameters={"delivered_date": delivered_iso},
+            filters={"id": order_id},
+            return_updated_rows=False
         )
         
         # Verify complete lifecycle
+        result = _fetch_rows(connected_db_with_timestamps, "orders", id=order_id)
         assert len(result) == 1
-        assert result.iloc[0]["order_number"] == "ORD-12345"
-        assert result.iloc[0]["order_date"] == order_date.isoformat()
-        assert result.iloc[0]["shipped_date"] == shipped_date.isoformat()
-        assert result.iloc[0]["delivered_date"] == delivered_date.isoformat()
+        assert result[0]["order_number"] == "ORD-12345"
+        assert result[0]["order_date"] == order_iso
+        assert result[0]["shipped_date"] == shipped_iso
+        assert result[0]["delivered_date"] == delivered_iso
     
     def test_timestamp_with_different_formats(self, connected_db_with_timestamps):
         """Test handling timestamps in different string formats"""
@@ -1328,20 +1499,20 @@ class TestSQLiteConnectionTimestamps:
     def test_timestamp_edge_cases(self, connected_db_with_timestamps):
         """Test edge cases with timestamps"""
         # Very old date
-        old_date = datetime(1970, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+        old_iso = datetime(1970, 1, 1, 0, 0, 0, tzinfo=timezone.utc).isoformat()
         # Future date
-        future_date = datetime(2099, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+        future_iso = datetime(2099, 12, 31, 23, 59, 59, tzinfo=timezone.utc).isoformat()
         
         events = [
-            {"event_name": "Old Event", "created_at": old_date.isoformat(), "event_date": "1970-01-01"},
-            {"event_name": "Future Event", "created_at": future_date.isoformat(), "event_date": "2099-12-31"},
+            {"event_name": "Old Event", "created_at": old_iso, "event_date": "1970-01-01"},
+            {"event_name": "Future Event", "created_at": future_iso, "event_date": "2099-12-31"},
         ]
         
         result = connected_db_with_timestamps.insert("events", events)
         
         assert len(result) == 2
-        assert result.iloc[0]["created_at"] == old_date.isoformat()
-        assert result.iloc[1]["created_at"] == future_date.isoformat()
+        assert result.iloc[0]["created_at"] == old_iso
+        assert result.iloc[1]["created_at"] == future_iso
     
     def test_query_recent_events_with_timestamp_comparison(self, connected_db_with_timestamps):
         """Test querying recent events using raw SQL with timestamp comparison"""
@@ -1373,12 +1544,11 @@ class TestSQLiteConnectionTimestamps:
         base_time = datetime(2025, 11, 9, 12, 0, 0, tzinfo=timezone.utc)
         
         # Create 10 events with incrementing timestamps
+        times = pd.date_range(base_time, periods=10, freq="5min")
+        iso_times = [t.isoformat() for t in times]
+        event_dates = times.strftime("%Y-%m-%d")
         events = [
-            {
-                "event_name": f"Event {i}",
-                "created_at": (base_time + timedelta(minutes=i*5)).isoformat(),
-                "event_date": (base_time + timedelta(minutes=i*5)).strftime("%Y-%m-%d")
-            }
+            {"event_name": f"Event {i}", "created_at": iso_times[i], "event_date": event_dates[i]}
             for i in range(10)
         ]
         
@@ -1386,35 +1556,19 @@ class TestSQLiteConnectionTimestamps:
         
         assert len(result) == 10
         # Verify timestamps are sequential
-        for i in range(10):
-            expected_time = (base_time + timedelta(minutes=i*5)).isoformat()
-            assert result.iloc[i]["created_at"] == expected_time
+        assert result["created_at"].tolist() == iso_times
 
 
 class TestSQLiteConnectionDtype:
     """Test cases for dtype parameter in SQLite operations"""
     
     @pytest.fixture
-    def connected_db_with_mixed_types(self, temp_db_path):
-        """Provide a connected SQLiteConnection instance with mixed data types table"""
-        db = SQLiteConnection(temp_db_path, primary_key_column="id")
+    def connected_db_with_mixed_types(self, products_template):
+        """Provide a connected in-memory SQLiteConnection instance with mixed data types table"""
+        db = SQLiteConnection(":memory:", primary_key_column="id")
         db._connect_db()
-        
-        # Create table with various data types stored as TEXT/INTEGER/REAL
-        db.execute("""
-            CREATE TABLE IF NOT EXISTS products (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                price REAL,
-                quantity INTEGER,
-                is_available INTEGER,
-                rating REAL,
-                sku TEXT,
-                discount_percent REAL,
-                stock_level INTEGER,
-                category_id INTEGER
-            )
-        """)
+        # Copy the prebuilt schema pages instead of re-running the DDL
+        products_template.backup(db.db_connection)
         
         yield db
         db._disconnect_db()